@@ -16,7 +16,6 @@ from sqlalchemy import text, bindparam
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from database.simple_connection import db as simple_db_instance
 from api.services.ghl_api import GoHighLevelAPI
-from api.services.field_mapper import field_mapper
 from api.services.location_service import location_service
 from config import AppConfig
 
@@ -42,6 +41,7 @@ async def sync_single_vendor(contact_id: str):
     
     This endpoint can be called by GHL webhook when a vendor contact is updated
     """
+    sync_service = None
     try:
         logger.info(f"🔄 Single vendor sync initiated for GHL contact: {contact_id}")
         
@@ -123,6 +123,9 @@ async def sync_single_vendor(contact_id: str):
             "message": f"Sync failed: {str(e)}",
             "error": str(e)
         }
+    finally:
+        if sync_service is not None:
+            sync_service.close()
 
 def _run_sync_blocking(job_id: str) -> None:
     """Run sync in thread; store result in _sync_jobs to avoid 504 gateway timeout. Uses V3 (unified fetch, POST /contacts/search)."""
@@ -4,7 +4,7 @@ import logging
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
-from api.services.field_mapper import field_mapper
+from api.services.field_mapper import get_field_mapper
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/field-mappings", tags=["Field Mapping Management"])
@@ -26,8 +26,8 @@ class TestPayloadModel(BaseModel):
 async def get_all_field_mappings():
     """Get all current field mappings"""
     try:
-        mappings = field_mapper.get_all_mappings()
-        stats = field_mapper.get_mapping_stats()
+        mappings = get_field_mapper().get_all_mappings()
+        stats = get_field_mapper().get_mapping_stats()
         
         return {
             "status": "success",
@@ -43,7 +43,7 @@ async def get_all_field_mappings():
 async def get_mapping_statistics():
     """Get field mapping statistics"""
     try:
-        stats = field_mapper.get_mapping_stats()
+        stats = get_field_mapper().get_mapping_stats()
         return {
             "status": "success",
             "statistics": stats
@@ -56,7 +56,7 @@ async def get_mapping_statistics():
 async def get_industry_mappings(industry: str):
     """Get field mappings for a specific industry"""
     try:
-        all_mappings = field_mapper.get_all_mappings()
+        all_mappings = get_field_mapper().get_all_mappings()
         industry_mappings = all_mappings.get("industry_specific", {}).get(industry, {})
         default_mappings = all_mappings.get("default_mappings", {})
         
@@ -75,7 +75,7 @@ async def get_industry_mappings(industry: str):
 async def add_field_mapping(mapping: FieldMappingModel):
     """Add a new field mapping"""
     try:
-        field_mapper.add_mapping(
+        get_field_mapper().add_mapping(
             source_field=mapping.source_field,
             target_field=mapping.target_field,
             industry=mapping.industry
@@ -100,8 +100,8 @@ async def add_field_mapping(mapping: FieldMappingModel):
 async def update_bulk_mappings(bulk_mappings: BulkMappingsModel):
     """Update all field mappings with new data"""
     try:
-        field_mapper.update_mappings(bulk_mappings.mappings)
-        stats = field_mapper.get_mapping_stats()
+        get_field_mapper().update_mappings(bulk_mappings.mappings)
+        stats = get_field_mapper().get_mapping_stats()
         
         logger.info(f"Updated bulk field mappings: {stats['total_mappings']} total mappings")
         
@@ -118,7 +118,7 @@ async def update_bulk_mappings(bulk_mappings: BulkMappingsModel):
 async def remove_field_mapping(source_field: str, industry: Optional[str] = None):
     """Remove a field mapping"""
     try:
-        field_mapper.remove_mapping(source_field=source_field, industry=industry)
+        get_field_mapper().remove_mapping(source_field=source_field, industry=industry)
         
         logger.info(f"Removed field mapping: {source_field} (industry: {industry})")
         
@@ -137,12 +137,12 @@ async def test_field_mapping(test_data: TestPayloadModel):
     """Test field mapping on a sample payload"""
     try:
         original_payload = test_data.payload
-        mapped_payload = field_mapper.map_payload(original_payload, test_data.industry)
+        mapped_payload = get_field_mapper().map_payload(original_payload, test_data.industry)
         
         # Create mapping details for response
         mapping_details = []
         for original_field, value in original_payload.items():
-            mapped_field = field_mapper.get_mapping(original_field, test_data.industry)
+            mapped_field = get_field_mapper().get_mapping(original_field, test_data.industry)
             mapping_details.append({
                 "original_field": original_field,
                 "mapped_field": mapped_field,
@@ -167,7 +167,7 @@ async def test_field_mapping(test_data: TestPayloadModel):
 async def get_reverse_mapping(ghl_field: str, industry: str = "marine"):
     """Get the form field name that maps to a GHL field"""
     try:
-        form_field = field_mapper.get_reverse_mapping(ghl_field, industry)
+        form_field = get_field_mapper().get_reverse_mapping(ghl_field, industry)
         
         return {
             "status": "success",
@@ -198,8 +198,8 @@ async def import_mappings_from_csv(request: Request):
 async def export_mappings():
     """Export current field mappings for backup or sharing"""
     try:
-        mappings = field_mapper.get_all_mappings()
-        stats = field_mapper.get_mapping_stats()
+        mappings = get_field_mapper().get_all_mappings()
+        stats = get_field_mapper().get_mapping_stats()
         
         export_data = {
             "export_info": {
@@ -223,7 +223,7 @@ async def export_mappings():
 async def validate_mappings():
     """Validate current field mappings for consistency and conflicts"""
     try:
-        mappings = field_mapper.get_all_mappings()
+        mappings = get_field_mapper().get_all_mappings()
         validation_results = {
             "is_valid": True,
             "errors": [],
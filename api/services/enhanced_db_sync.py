@@ -10,10 +10,14 @@ Created: 2025
 
 import json
 import logging
+import sqlite3
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 
 # Add project root to path (going up two directories from api/services/)
@@ -26,6 +30,12 @@ from api.services.ghl_api_v2_optimized import OptimizedGoHighLevelAPI
 from api.services.location_service import location_service
 from database.simple_connection import db as simple_db_instance
 
+# orjson is an optional, faster drop-in for parsing the JSON list fields
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +44,44 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _compile_lead_field_diff(lead_ghl_fields: Dict[str, Any], name: str, first_only: bool):
+    """
+    Generate a straight-line lead diff function from the (fixed) field mapping.
+    
+    The generated function takes (self, lead, ghl_contact, custom_fields) and
+    either returns True on the first differing field (first_only) or a dict of
+    {db_field: new_value} for every differing field. Comparison matches the
+    default string path of _values_differ (None and '' are equal).
+    """
+    lines = [f"def {name}(self, lead, ghl_contact, custom_fields):"]
+    if not first_only:
+        lines.append("    updates = {}")
+    
+    for db_field, ghl_field in lead_ghl_fields.items():
+        if ghl_field is None:
+            # Derived fields are handled separately
+            continue
+        if isinstance(ghl_field, list):
+            if db_field != 'customer_name' or ghl_field != ['firstName', 'lastName']:
+                continue
+            value_expr = ("(ghl_contact.get('firstName', '').strip() + ' ' + "
+                          "ghl_contact.get('lastName', '').strip()).strip()")
+        elif ghl_field in ['email', 'phone']:
+            value_expr = f"ghl_contact.get({ghl_field!r}, '').strip()"
+        else:
+            value_expr = f"custom_fields.get({ghl_field!r}, '')"
+        
+        lines.append(f"    value = {value_expr}")
+        lines.append(f"    if str(lead[{db_field!r}] or '').strip() != value:")
+        lines.append("        return True" if first_only else f"        updates[{db_field!r}] = value")
+    
+    lines.append("    return False" if first_only else "    return updates")
+    
+    namespace = {}
+    exec(compile("\n".join(lines), f"<generated {name}>", "exec"), namespace)
+    return namespace[name]
+
+
 class EnhancedDatabaseSync:
     """
     Enhanced sync service that updates existing database records
@@ -71,6 +119,16 @@ class EnhancedDatabaseSync:
         'service_state': None    # Derived from ZIP
     }
     
+    # Lead field diffs specialized from LEAD_GHL_FIELDS at class load
+    _lead_has_changes = _compile_lead_field_diff(LEAD_GHL_FIELDS, '_lead_has_changes', first_only=True)
+    _lead_field_updates = _compile_lead_field_diff(LEAD_GHL_FIELDS, '_lead_field_updates', first_only=False)
+    
+    # Minimum spacing between GHL requests, shared by the concurrent vendor and lead checks
+    GHL_RATE_LIMIT_DELAY = 0.1
+    
+    # Set once the GHL contact ID lookup index has been verified for this process
+    _sync_indexes_ready = False
+    
     def __init__(self):
         """Initialize the enhanced sync service"""
         try:
@@ -79,6 +137,15 @@ class EnhancedDatabaseSync:
             load_dotenv()
             import os
             
+            # One connection (and write cursor), opened on first use and released by close()
+            self._conn = None
+            self._cursor = None
+            self._updated_at = None
+            
+            # Paces GHL requests across the concurrent vendor and lead checks
+            self._ghl_pace_lock = threading.Lock()
+            self._last_ghl_request = 0.0
+            
             # Initialize GHL API with environment variables
             # Use optimized v2 API for better performance
             self.ghl_api = OptimizedGoHighLevelAPI(
@@ -153,7 +220,8 @@ class EnhancedDatabaseSync:
             
             if updates:
                 # Apply updates
-                success = self._update_vendor_record(vendor['id'], updates)
+                with self._transaction():
+                    success = self._update_vendor_record(vendor['id'], updates)
                 if success:
                     logger.info(f"✅ Updated vendor {vendor.get('name')}: {len(updates)} fields")
                     return {
@@ -184,6 +252,8 @@ class EnhancedDatabaseSync:
                 'success': False,
                 'error': str(e)
             }
+        finally:
+            self.close()
     
     def sync_all(self) -> Dict[str, Any]:
         """
@@ -196,13 +266,23 @@ class EnhancedDatabaseSync:
         self.stats['start_time'] = datetime.now()
         
         try:
-            # Step 1: Sync Vendors
-            logger.info("\n📊 STEP 1: Syncing Vendor Records")
-            vendor_results = self._sync_vendors()
-            
-            # Step 2: Sync Leads
-            logger.info("\n📊 STEP 2: Syncing Lead Records")
-            lead_results = self._sync_leads()
+            self._ensure_sync_indexes()
+            
+            # Step 1: Compare vendors and leads concurrently - both phases are
+            # dominated by GHL API latency and only read from the database;
+            # _pace_ghl_request spaces the GHL requests of both threads
+            logger.info("\n📊 STEP 1: Checking Vendor and Lead Records")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                vendor_future = executor.submit(self._collect_vendor_updates)
+                lead_future = executor.submit(self._collect_lead_updates)
+                pending_vendors = vendor_future.result()
+                pending_leads = lead_future.result()
+            
+            # Step 2: Apply all writes from this thread in one transaction
+            logger.info("\n📊 STEP 2: Writing Vendor and Lead Updates")
+            with self._transaction():
+                self._apply_updates('vendor', pending_vendors, self._update_vendor_record)
+                self._apply_updates('lead', pending_leads, self._update_lead_record)
             
             self.stats['end_time'] = datetime.now()
             
@@ -241,9 +321,83 @@ class EnhancedDatabaseSync:
                 'error': str(e),
                 'message': f"Sync failed: {str(e)}"
             }
+        finally:
+            self.close()
+    
+    def _pace_ghl_request(self):
+        """Block until GHL_RATE_LIMIT_DELAY has passed since the last paced GHL request"""
+        with self._ghl_pace_lock:
+            wait = self.GHL_RATE_LIMIT_DELAY - (time.monotonic() - self._last_ghl_request)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_ghl_request = time.monotonic()
+    
+    def _ensure_sync_indexes(self):
+        """
+        Make sure leads.ghl_contact_id is indexed for the GHL contact lookups.
+        vendors.ghl_contact_id is declared UNIQUE, so SQLite already indexes it.
+        """
+        if EnhancedDatabaseSync._sync_indexes_ready:
+            return
+        
+        try:
+            conn = self._connection()
+            cursor = conn.cursor()
+            
+            # Reuse any existing index that leads with ghl_contact_id
+            already_indexed = False
+            for index_row in cursor.execute("PRAGMA index_list(leads)").fetchall():
+                first_column = cursor.execute(f"PRAGMA index_info('{index_row[1]}')").fetchone()
+                if first_column and first_column[2] == 'ghl_contact_id':
+                    already_indexed = True
+                    break
+            
+            if not already_indexed:
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_leads_ghl_contact_id ON leads(ghl_contact_id)")
+                cursor.execute("ANALYZE leads")
+                conn.commit()
+                logger.info("✅ Created index idx_leads_ghl_contact_id")
+            
+            EnhancedDatabaseSync._sync_indexes_ready = True
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Could not verify sync indexes: {e}")
+    
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed record updates in a single explicit transaction"""
+        conn = self._connection()
+        # One updated_at value for the whole batch, in SQLite CURRENT_TIMESTAMP format (UTC)
+        self._updated_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            self._cursor.execute("BEGIN")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def _connection(self):
+        """Return the held database connection, opening it on first use"""
+        if self._conn is None:
+            self._conn = simple_db_instance._get_raw_conn()
+            self._cursor = self._conn.cursor()
+        return self._conn
     
-    def _sync_vendors(self) -> Dict[str, int]:
-        """Sync vendor records with targeted field updates"""
+    def close(self):
+        """Release the held database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._cursor = None
+    
+    def _execute_write(self, query: str, values: List[Any]):
+        """Execute a write inside the sync transaction (committed by _transaction as a whole)"""
+        self._cursor.execute(query, values)
+    
+    def _collect_vendor_updates(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Compare vendor records with GHL; returns pending (vendor_id, name, updates) writes"""
+        pending = []
         
         try:
             # Get all vendors from database
@@ -277,6 +431,7 @@ class EnhancedDatabaseSync:
                     logger.debug(f"   Current status: {vendor.get('status')}")
                     logger.debug(f"   Current coverage: {vendor.get('coverage_type')}")
                     
+                    self._pace_ghl_request()
                     ghl_contact = self.ghl_api.get_contact_by_id(ghl_contact_id)
                     
                     if not ghl_contact:
@@ -288,42 +443,33 @@ class EnhancedDatabaseSync:
                     updates = self._extract_vendor_updates(vendor, ghl_contact)
                     
                     if updates:
-                        # Update vendor in database
-                        success = self._update_vendor_record(vendor['id'], updates)
-                        if success:
-                            self.stats['vendors_updated'] += 1
-                            self.stats['fields_updated'] += len(updates)
-                            logger.info(f"✅ Updated vendor {vendor.get('name')}: {len(updates)} fields")
-                        else:
-                            self.stats['vendors_errors'] += 1
+                        # Queue the write; applied after both detect phases finish
+                        pending.append((vendor['id'], vendor.get('name'), updates))
                     else:
                         self.stats['vendors_skipped'] += 1
                         logger.debug(f"⏭️  No updates needed for vendor {vendor.get('name')}")
                     
-                    # Small delay to avoid API rate limits
-                    time.sleep(0.1)
-                    
                 except Exception as e:
                     logger.error(f"❌ Error processing vendor {vendor.get('name')}: {e}")
                     self.stats['vendors_errors'] += 1
             
-            return {
-                'checked': self.stats['vendors_checked'],
-                'updated': self.stats['vendors_updated'],
-                'errors': self.stats['vendors_errors']
-            }
+            return pending
             
         except Exception as e:
             logger.error(f"❌ Error in vendor sync: {e}")
-            return {'checked': 0, 'updated': 0, 'errors': 1}
+            self.stats['vendors_errors'] += 1
+            return pending
     
-    def _sync_leads(self) -> Dict[str, int]:
-        """Sync lead records with targeted field updates"""
+    def _collect_lead_updates(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Compare lead records with GHL; returns pending (lead_id, name, updates) writes"""
+        pending = []
         
         try:
             # Get all leads from database
-            conn = simple_db_instance._get_raw_conn()
-            cursor = conn.cursor()
+            cursor = self._connection().cursor()
+            # Keyed rows without an intermediate dict copy (cursor-level so the
+            # pooled connection keeps its default tuple rows)
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute("""
                 SELECT id, ghl_contact_id, customer_name, customer_email, 
@@ -334,22 +480,7 @@ class EnhancedDatabaseSync:
                 WHERE ghl_contact_id IS NOT NULL
             """)
             
-            leads = []
-            for row in cursor.fetchall():
-                leads.append({
-                    'id': row[0],
-                    'ghl_contact_id': row[1],
-                    'customer_name': row[2],
-                    'customer_email': row[3],
-                    'customer_phone': row[4],
-                    'primary_service_category': row[5],
-                    'specific_service_requested': row[6],
-                    'customer_zip_code': row[7],
-                    'service_county': row[8],
-                    'service_state': row[9]
-                })
-            
-            conn.close()
+            leads = cursor.fetchall()
             
             logger.info(f"Found {len(leads)} leads with GHL contact IDs")
             
@@ -358,7 +489,8 @@ class EnhancedDatabaseSync:
                 
                 try:
                     # Get contact from GHL
-                    logger.debug(f"Fetching GHL data for lead: {lead.get('customer_name', 'Unknown')}")
+                    logger.debug(f"Fetching GHL data for lead: {lead['customer_name'] or 'Unknown'}")
+                    self._pace_ghl_request()
                     ghl_contact = self.ghl_api.get_contact_by_id(lead['ghl_contact_id'])
                     
                     if not ghl_contact:
@@ -370,49 +502,52 @@ class EnhancedDatabaseSync:
                     updates = self._extract_lead_updates(lead, ghl_contact)
                     
                     if updates:
-                        # Update lead in database
-                        success = self._update_lead_record(lead['id'], updates)
-                        if success:
-                            self.stats['leads_updated'] += 1
-                            self.stats['fields_updated'] += len(updates)
-                            logger.info(f"✅ Updated lead {lead.get('customer_name')}: {len(updates)} fields")
-                        else:
-                            self.stats['leads_errors'] += 1
+                        # Queue the write; applied after both detect phases finish
+                        pending.append((lead['id'], lead['customer_name'], updates))
                     else:
                         self.stats['leads_skipped'] += 1
-                        logger.debug(f"⏭️  No updates needed for lead {lead.get('customer_name')}")
-                    
-                    # Small delay to avoid API rate limits
-                    time.sleep(0.1)
+                        logger.debug(f"⏭️  No updates needed for lead {lead['customer_name']}")
                     
                 except Exception as e:
-                    logger.error(f"❌ Error processing lead {lead.get('customer_name')}: {e}")
+                    logger.error(f"❌ Error processing lead {lead['customer_name']}: {e}")
                     self.stats['leads_errors'] += 1
             
-            return {
-                'checked': self.stats['leads_checked'],
-                'updated': self.stats['leads_updated'],
-                'errors': self.stats['leads_errors']
-            }
+            return pending
             
         except Exception as e:
             logger.error(f"❌ Error in lead sync: {e}")
-            return {'checked': 0, 'updated': 0, 'errors': 1}
+            self.stats['leads_errors'] += 1
+            return pending
     
-    def _extract_vendor_updates(self, vendor: Dict, ghl_contact: Dict) -> Dict[str, Any]:
-        """Extract fields that need updating for a vendor"""
-        updates = {}
-        
-        # Extract custom fields from GHL contact
+    def _apply_updates(self, record_type: str, pending: List[Tuple[str, str, Dict[str, Any]]], update_record) -> None:
+        """Write queued updates for one record type ('vendor' or 'lead')"""
+        for record_id, record_name, updates in pending:
+            if update_record(record_id, updates):
+                self.stats[f'{record_type}s_updated'] += 1
+                self.stats['fields_updated'] += len(updates)
+                logger.info(f"✅ Updated {record_type} {record_name}: {len(updates)} fields")
+            else:
+                self.stats[f'{record_type}s_errors'] += 1
+    
+    def _normalize_custom_fields(self, ghl_contact: Dict) -> Dict[str, str]:
+        """Map GHL custom field IDs to their stripped string values, once per contact"""
         custom_fields = {}
         for field in ghl_contact.get('customFields', []):
             field_id = field.get('id', '')
-            field_value = field.get('value', '') or field.get('fieldValue', '')
             if field_id:
-                custom_fields[field_id] = field_value
+                field_value = field.get('value', '') or field.get('fieldValue', '')
+                custom_fields[field_id] = field_value.strip() if isinstance(field_value, str) else ''
+        return custom_fields
+    
+    def _extract_vendor_updates(self, vendor: Dict, ghl_contact: Dict) -> Dict[str, Any]:
+        """Extract fields that need updating for a vendor"""
+        updates = {}
+        
+        # Extract custom fields from GHL contact (values already stripped)
+        custom_fields = self._normalize_custom_fields(ghl_contact)
         
         # CRITICAL: Check for GHL User ID and activate vendor if found
-        ghl_user_id_from_contact = custom_fields.get('HXVNT4y8OynNokWAfO2D', '').strip()
+        ghl_user_id_from_contact = custom_fields.get('HXVNT4y8OynNokWAfO2D', '')
         if ghl_user_id_from_contact:
             # If vendor has a GHL user ID in GHL but not in DB, update it
             if not vendor.get('ghl_user_id'):
@@ -425,7 +560,7 @@ class EnhancedDatabaseSync:
                 logger.info(f"   ✅ Activating vendor - GHL User ID present: {ghl_user_id_from_contact}")
         
         # Process service_zip_codes to derive coverage fields
-        service_zip_codes_value = custom_fields.get('yDcN0FmwI3xacyxAuTWs', '').strip()
+        service_zip_codes_value = custom_fields.get('yDcN0FmwI3xacyxAuTWs', '')
         derived_coverage_type = None
         derived_coverage_states = None
         derived_coverage_counties = None
@@ -434,7 +569,7 @@ class EnhancedDatabaseSync:
             logger.info(f"   📍 Processing service_zip_codes: {service_zip_codes_value[:100]}...")
             
             # Normalize the value for comparison
-            normalized_value = service_zip_codes_value.upper().strip()
+            normalized_value = service_zip_codes_value.upper()
             
             # Determine coverage type based on the format of service_zip_codes
             if 'GLOBAL' in normalized_value:
@@ -504,6 +639,9 @@ class EnhancedDatabaseSync:
                 continue
                 
             current_value = vendor.get(db_field)
+            if db_field == 'lead_close_percentage':
+                # Compare percentages as integer basis points
+                current_value = self._percentage_to_basis_points(current_value)
             new_value = None
             
             # Handle different field types
@@ -520,7 +658,7 @@ class EnhancedDatabaseSync:
                 # Try each field ID until we find one with a value
                 new_value = ''
                 for field_id in ghl_field:
-                    temp_value = custom_fields.get(field_id, '').strip()
+                    temp_value = custom_fields.get(field_id, '')
                     if temp_value:
                         new_value = temp_value
                         logger.info(f"   📋 Found {db_field} in field ID {field_id}: {temp_value[:50]}...")
@@ -529,7 +667,7 @@ class EnhancedDatabaseSync:
                     logger.debug(f"   ⚠️ No value found for {db_field} in any of the field IDs: {ghl_field}")
             else:
                 # Custom field (single field ID)
-                new_value = custom_fields.get(ghl_field, '').strip()
+                new_value = custom_fields.get(ghl_field, '')
                 if new_value:
                     logger.debug(f"   📋 Found {db_field}: {new_value[:50]}...")
             
@@ -552,25 +690,19 @@ class EnhancedDatabaseSync:
                     logger.debug(f"   🔄 Setting {db_field} to empty array")
             
             elif db_field == 'lead_close_percentage':
-                # Convert percentage to float
-                if new_value:
-                    try:
-                        new_value = float(new_value.replace('%', '').strip())
-                    except:
-                        new_value = 0.0
-                else:
-                    new_value = 0.0
+                # Normalize percentage to integer basis points
+                new_value = self._percentage_to_basis_points(new_value)
             
             elif db_field == 'taking_new_work':
                 # Normalize Yes/No values to boolean
                 if new_value:
-                    normalized = new_value.strip().lower()
+                    normalized = new_value.lower()
                     if normalized in ['yes', 'true', '1']:
                         new_value = 'Yes'
                     elif normalized in ['no', 'false', '0']:
                         new_value = 'No'
                     else:
-                        new_value = new_value.strip().title()
+                        new_value = new_value.title()
             
             elif db_field == 'primary_service_category':
                 # Keep as string - it's a single category
@@ -584,6 +716,9 @@ class EnhancedDatabaseSync:
             
             # Compare and add to updates if different
             if new_value is not None and self._values_differ(current_value, new_value, db_field):
+                if db_field == 'lead_close_percentage':
+                    # Stored as a REAL percentage in the database
+                    new_value = new_value / 100
                 updates[db_field] = new_value
                 logger.debug(f"   {db_field}: '{current_value}' → '{new_value}'")
         
@@ -614,54 +749,24 @@ class EnhancedDatabaseSync:
         
         return updates
     
-    def _extract_lead_updates(self, lead: Dict, ghl_contact: Dict) -> Dict[str, Any]:
+    def _extract_lead_updates(self, lead: sqlite3.Row, ghl_contact: Dict) -> Dict[str, Any]:
         """Extract fields that need updating for a lead"""
-        updates = {}
+        # Extract custom fields from GHL contact (values already stripped)
+        custom_fields = self._normalize_custom_fields(ghl_contact)
         
-        # Extract custom fields from GHL contact
-        custom_fields = {}
-        for field in ghl_contact.get('customFields', []):
-            field_id = field.get('id', '')
-            field_value = field.get('value', '') or field.get('fieldValue', '')
-            if field_id:
-                custom_fields[field_id] = field_value
+        # Most leads are unchanged - skip building the updates dict for them.
+        # A derived (ZIP) change always implies customer_zip_code differs.
+        if not self._lead_has_changes(lead, ghl_contact, custom_fields):
+            return {}
         
         # Check each mapped field
-        for db_field, ghl_field in self.LEAD_GHL_FIELDS.items():
-            current_value = lead.get(db_field)
-            
-            # Handle standard fields
-            if isinstance(ghl_field, list):
-                # Combine firstName and lastName for name field
-                if db_field == 'customer_name' and ghl_field == ['firstName', 'lastName']:
-                    first = ghl_contact.get('firstName', '').strip()
-                    last = ghl_contact.get('lastName', '').strip()
-                    new_value = f"{first} {last}".strip()
-                else:
-                    continue
-            elif ghl_field in ['email', 'phone']:
-                # Map to customer_ prefixed fields
-                if db_field == 'customer_email':
-                    new_value = ghl_contact.get('email', '').strip()
-                elif db_field == 'customer_phone':
-                    new_value = ghl_contact.get('phone', '').strip()
-                else:
-                    new_value = ghl_contact.get(ghl_field, '').strip()
-            elif ghl_field is None:
-                # Skip derived fields (will handle separately)
-                continue
-            else:
-                # Custom field
-                new_value = custom_fields.get(ghl_field, '').strip()
-            
-            # Compare and add to updates if different
-            if self._values_differ(current_value, new_value, db_field):
-                updates[db_field] = new_value
-                logger.debug(f"   {db_field}: '{current_value}' → '{new_value}'")
+        updates = self._lead_field_updates(lead, ghl_contact, custom_fields)
+        for db_field, new_value in updates.items():
+            logger.debug(f"   {db_field}: '{lead[db_field]}' → '{new_value}'")
         
         # Handle derived fields (county and state from ZIP)
-        zip_code = custom_fields.get(self.LEAD_GHL_FIELDS['customer_zip_code'], '').strip()
-        if zip_code and zip_code != lead.get('customer_zip_code'):
+        zip_code = custom_fields.get(self.LEAD_GHL_FIELDS['customer_zip_code'], '')
+        if zip_code and zip_code != lead['customer_zip_code']:
             updates['customer_zip_code'] = zip_code
             
             # Get county and state from ZIP
@@ -670,13 +775,23 @@ class EnhancedDatabaseSync:
                 county = location_data.get('county', '')
                 state = location_data.get('state', '')
                 
-                if county != lead.get('service_county'):
+                if county != lead['service_county']:
                     updates['service_county'] = county
-                if state != lead.get('service_state'):
+                if state != lead['service_state']:
                     updates['service_state'] = state
         
         return updates
     
+    def _percentage_to_basis_points(self, value: Any) -> int:
+        """Normalize a percentage (e.g. 45.5, '45.5%') to integer basis points"""
+        if not value:
+            return 0
+        try:
+            return int(round(float(str(value).replace('%', '').strip()) * 100))
+        except (ValueError, OverflowError):
+            # Not a number, or 'inf'/'nan' from GHL
+            return 0
+    
     def _values_differ(self, current: Any, new: Any, field_name: str) -> bool:
         """Check if two values are different, handling various data types"""
         
@@ -689,19 +804,10 @@ class EnhancedDatabaseSync:
         # Handle JSON fields
         if field_name in ['service_categories', 'services_offered', 'coverage_states', 'coverage_counties']:
             try:
-                current_list = json.loads(current) if current else []
-                new_list = json.loads(new) if new else []
+                current_list = _json_loads(current) if current else []
+                new_list = _json_loads(new) if new else []
                 return set(current_list) != set(new_list)
-            except:
-                return str(current) != str(new)
-        
-        # Handle numeric fields
-        if field_name == 'lead_close_percentage':
-            try:
-                current_float = float(current) if current else 0.0
-                new_float = float(new) if new else 0.0
-                return abs(current_float - new_float) > 0.01
-            except:
+            except (ValueError, TypeError, json.JSONDecodeError):
                 return str(current) != str(new)
         
         # Default string comparison
@@ -713,33 +819,14 @@ class EnhancedDatabaseSync:
             if not updates:
                 return True
             
-            # Build UPDATE query
-            set_clauses = []
-            values = []
-            
-            for field, value in updates.items():
-                set_clauses.append(f"{field} = ?")
-                values.append(value)
-            
-            # Add updated_at
-            set_clauses.append("updated_at = CURRENT_TIMESTAMP")
-            
-            # Add vendor_id for WHERE clause
-            values.append(vendor_id)
+            # Build UPDATE query; updated_at is computed once per sync transaction
+            columns = tuple(updates)
+            assignments = ", ".join(f"{field} = ?" for field in columns)
+            query = f"UPDATE vendors SET {assignments}, updated_at = ? WHERE id = ?"
+            values = [updates[field] for field in columns] + [self._updated_at, vendor_id]
             
-            # Execute update
-            conn = simple_db_instance._get_raw_conn()
-            cursor = conn.cursor()
-            
-            query = f"""
-                UPDATE vendors 
-                SET {', '.join(set_clauses)}
-                WHERE id = ?
-            """
-            
-            cursor.execute(query, values)
-            conn.commit()
-            conn.close()
+            # Execute update (committed by the enclosing sync transaction)
+            self._execute_write(query, values)
             
             return True
             
@@ -753,33 +840,14 @@ class EnhancedDatabaseSync:
             if not updates:
                 return True
             
-            # Build UPDATE query
-            set_clauses = []
-            values = []
-            
-            for field, value in updates.items():
-                set_clauses.append(f"{field} = ?")
-                values.append(value)
-            
-            # Add updated_at
-            set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+            # Build UPDATE query; updated_at is computed once per sync transaction
+            columns = tuple(updates)
+            assignments = ", ".join(f"{field} = ?" for field in columns)
+            query = f"UPDATE leads SET {assignments}, updated_at = ? WHERE id = ?"
+            values = [updates[field] for field in columns] + [self._updated_at, lead_id]
             
-            # Add lead_id for WHERE clause
-            values.append(lead_id)
-            
-            # Execute update
-            conn = simple_db_instance._get_raw_conn()
-            cursor = conn.cursor()
-            
-            query = f"""
-                UPDATE leads 
-                SET {', '.join(set_clauses)}
-                WHERE id = ?
-            """
-            
-            cursor.execute(query, values)
-            conn.commit()
-            conn.close()
+            # Execute update (committed by the enclosing sync transaction)
+            self._execute_write(query, values)
             
             return True
             
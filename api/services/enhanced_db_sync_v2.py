@@ -12,11 +12,23 @@ Handles:
 
 import json
 import logging
+import re
+import sqlite3
 import sys
 import os
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import time
+import threading
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -27,6 +39,98 @@ from database.simple_connection import db as simple_db_instance
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between paced GHL requests, shared by the vendor and lead fetch threads
+GHL_RATE_LIMIT_DELAY = 0.12
+# Concurrent get_contact_by_id calls in the lead fetch (still paced by GHL_RATE_LIMIT_DELAY)
+GHL_FETCH_BY_ID_WORKERS = 4
+# GHL contact list scan: page size and concurrent page requests per wave
+GHL_PAGE_LIMIT = 100
+GHL_PAGE_FETCH_WORKERS = 5
+# Identifiers per filtered POST /contacts/search request
+GHL_SEARCH_BATCH_SIZE = 100
+# 5-digit ZIP embedded in a GHL address line
+_ZIP_RE = re.compile(r'\b(\d{5})\b')
+# Rows buffered per fetch while iterating the leads table
+LEAD_ROW_FETCH_SIZE = 1000
+# Per-connection SQLite settings for the sync connection, restored in close()
+SQLITE_SYNC_PRAGMAS = (('synchronous', 'NORMAL'), ('temp_store', 'MEMORY'), ('cache_size', '-65536'))
+# Bound parameters per "WHERE id IN (...)" query (SQLite caps host parameters)
+SQL_IN_BATCH_SIZE = 500
+
+
+@dataclass
+class VendorTable:
+    """Column-oriented snapshot of the vendor keys, with GHL ID / email -> row index lookups"""
+    ids: List[str] = field(default_factory=list)
+    names: List[Optional[str]] = field(default_factory=list)
+    emails: List[Optional[str]] = field(default_factory=list)
+    ghl_contact_ids: List[Optional[str]] = field(default_factory=list)
+    by_ghl_id: Dict[str, int] = field(default_factory=dict)
+    by_email: Dict[str, int] = field(default_factory=dict)  # lowercased; vendors without a GHL ID
+    
+    def append(self, vendor_id: str, name: Optional[str], email: Optional[str],
+               ghl_contact_id: Optional[str]) -> int:
+        """Add one vendor row and index it; returns the row index"""
+        idx = len(self.ids)
+        self.ids.append(vendor_id)
+        self.names.append(name)
+        self.emails.append(email)
+        self.ghl_contact_ids.append(ghl_contact_id)
+        
+        email_lower = (email or '').lower()
+        if ghl_contact_id:
+            self.by_ghl_id[ghl_contact_id] = idx
+        elif email_lower:
+            self.by_email[email_lower] = idx
+        return idx
+    
+    def row(self, idx: int) -> Dict[str, Any]:
+        """Materialize one row as the vendor dict the update path works on"""
+        return {
+            'id': self.ids[idx],
+            'name': self.names[idx],
+            'email': self.emails[idx],
+            'ghl_contact_id': self.ghl_contact_ids[idx],
+        }
+
+
+@lru_cache(maxsize=10000)
+def _cached_zip_lookup(zip_code: str) -> Dict:
+    """location_service.zip_to_location memoized per ZIP; callers must not mutate the result"""
+    from api.services.location_service import location_service
+    return location_service.zip_to_location(zip_code)
+
+
+def _build_vendor_field_plan(field_map: Dict[str, Any]) -> Tuple[tuple, ...]:
+    """Resolve a GHL field mapping into (db_field, source, ghl_field, post) rows once.
+
+    source says where the value comes from ('name', 'standard', 'first_custom',
+    'custom') and post names the normalization applied before comparing.
+    """
+    plan = []
+    for db_field, ghl_field in field_map.items():
+        if db_field == 'service_zip_codes':
+            continue  # derived through coverage parsing instead
+        if db_field == 'name' and ghl_field == ['firstName', 'lastName']:
+            source = 'name'
+        elif ghl_field in ('email', 'phone'):
+            source = 'standard'
+        elif isinstance(ghl_field, list):
+            source, ghl_field = 'first_custom', tuple(ghl_field)
+        else:
+            source = 'custom'
+        
+        if db_field in ('service_categories', 'services_offered'):
+            post = 'list'
+        elif db_field == 'lead_close_percentage':
+            post = 'percentage'
+        elif db_field == 'taking_new_work':
+            post = 'yes_no'
+        else:
+            post = None
+        plan.append((db_field, source, ghl_field, post))
+    return tuple(plan)
+
 
 class EnhancedDatabaseSync:
     """
@@ -50,6 +154,41 @@ class EnhancedDatabaseSync:
         'primary_service_category': 'HRqfv0HnUydNRLKWhk27'
     }
     
+    # Every GHL field ID read from a contact during vendor sync
+    _NEEDED_FIELD_IDS = frozenset(
+        fid for v in VENDOR_GHL_FIELDS.values() for fid in (v if isinstance(v, list) else [v])
+    )
+    
+    # Vendor columns only needed once a vendor is matched to a GHL contact
+    _VENDOR_DETAIL_COLUMNS = (
+        'account_id', 'company_name', 'phone', 'ghl_user_id', 'service_categories',
+        'services_offered', 'coverage_type', 'coverage_states', 'coverage_counties',
+        'last_lead_assigned', 'lead_close_percentage', 'status', 'taking_new_work',
+        'created_at', 'updated_at'
+    )
+    
+    # Set once idx_leads_ghl_identifiers is known to exist (per process)
+    _lead_identifier_index_ready = False
+    
+    # Columns written for vendors first seen in GHL (see _create_local_vendor)
+    _NEW_VENDOR_COLUMNS = (
+        'id', 'account_id', 'name', 'company_name', 'email', 'phone', 'ghl_contact_id',
+        'status', 'service_categories', 'services_offered', 'coverage_type',
+        'coverage_states', 'coverage_counties', 'taking_new_work'
+    )
+    
+    # JSON list columns whose stored value is pre-parsed into a set by _load_vendor_details
+    _LIST_FIELDS = ('service_categories', 'services_offered')
+    
+    # GHL taking_new_work values stored as 'Yes' (anything else -> 'No')
+    _TRUTHY = frozenset({'yes', 'true', '1'})
+    
+    # Tag that marks a vendor as approved in GHL
+    _APPROVED_TAG = "manually approved"
+    
+    # Per-field extraction plan walked by _extract_vendor_updates
+    _VENDOR_FIELD_PLAN = _build_vendor_field_plan(VENDOR_GHL_FIELDS)
+    
     # GHL Field Mappings for Leads
     LEAD_GHL_FIELDS = {
         'customer_name': ['firstName', 'lastName'],
@@ -60,6 +199,19 @@ class EnhancedDatabaseSync:
         # Note: No standard ZIP field in GHL custom fields - need to check postalCode
     }
     
+    # Everything _extract_lead_updates reads, hashed by _lead_input_hash
+    _LEAD_CUSTOM_FIELD_IDS = tuple(
+        v for v in LEAD_GHL_FIELDS.values() if isinstance(v, str) and v not in ('email', 'phone')
+    )
+    _LEAD_HASH_FIELDS = (
+        'customer_name', 'customer_email', 'customer_phone', 'primary_service_category',
+        'specific_service_requested', 'service_zip_code', 'service_county', 'service_state'
+    )
+    _LEAD_CONTACT_HASH_KEYS = ('firstName', 'lastName', 'email', 'phone', 'postalCode', 'address1')
+    
+    # lead id -> input hash of its last diff that produced no updates (per process)
+    _unchanged_lead_hashes: Dict[str, int] = {}
+    
     def __init__(self):
         """Initialize the bi-directional sync service"""
         try:
@@ -73,6 +225,21 @@ class EnhancedDatabaseSync:
                 location_api_key=os.getenv('GHL_LOCATION_API') or AppConfig.GHL_LOCATION_API
             )
             
+            # Keep-alive session for the GHL contact list pages (one connection per page worker);
+            # transient 429/5xx responses on these GETs are retried with backoff
+            self._http = requests.Session()
+            self._http.headers.update({
+                "Authorization": f"Bearer {self.ghl_api.private_token}",
+                "Version": "2021-07-28"
+            })
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=max(8, GHL_PAGE_FETCH_WORKERS),
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+            )
+            self._http.mount("https://", adapter)
+            self._http.mount("http://", adapter)
+            
             self.stats = {
                 'vendors_checked': 0,
                 'vendors_updated': 0,
@@ -87,12 +254,89 @@ class EnhancedDatabaseSync:
                 'errors': []
             }
             
+            # Paces GHL requests across the concurrent vendor and lead fetches
+            self._ghl_pace_lock = threading.Lock()
+            self._last_ghl_request = 0.0
+            self._contact_scan_failed = False  # see _iter_ghl_contact_pages
+            self._unresolved_vendor_identifiers: Set[str] = set()  # see _fetch_all_ghl_vendors
+            
+            # Database connection held for the vendor phase of a sync (see _connection/close)
+            self._conn = None
+            self._restore_pragmas: List[Tuple[str, Any]] = []
+            
+            # Account for the GHL location, looked up once per sync by _get_location_account
+            self._account = None
+            self._account_loaded = False
+            
+            # New vendor rows, inserted together by _flush_new_vendors
+            self._pending_new_vendors: List[tuple] = []
+            
+            # Vendor / lead UPDATEs buffered per column set, flushed by _flush_*_updates
+            self._pending_vendor_updates: Dict[tuple, List[tuple]] = defaultdict(list)
+            self._pending_vendor_stats: Dict[str, str] = {}  # vendor id -> stats counter for its update
+            self._pending_lead_updates: Dict[tuple, List[tuple]] = defaultdict(list)
+            self._pending_lead_stats: Dict[str, str] = {}  # lead id -> stats counter for its update
+            
             logger.info("✅ Bi-directional Sync initialized")
             
         except Exception as e:
             logger.error(f"❌ Failed to initialize Bi-directional Sync: {e}")
             raise
     
+    def _pace_ghl_request(self):
+        """Block until GHL_RATE_LIMIT_DELAY has passed since the last paced GHL request"""
+        with self._ghl_pace_lock:
+            wait = GHL_RATE_LIMIT_DELAY - (time.monotonic() - self._last_ghl_request)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_ghl_request = time.monotonic()
+    
+    def _connection(self):
+        """Return the held database connection, opening it on first use (WAL + SQLITE_SYNC_PRAGMAS on SQLite)"""
+        if self._conn is None:
+            conn = simple_db_instance._get_raw_conn()
+            if simple_db_instance.engine.dialect.name == 'sqlite':
+                cursor = conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                for name, value in SQLITE_SYNC_PRAGMAS:
+                    cursor.execute(f"PRAGMA {name}")
+                    self._restore_pragmas.append((name, cursor.fetchone()[0]))
+                    cursor.execute(f"PRAGMA {name}={value}")
+            self._conn = conn
+        return self._conn
+    
+    def close(self):
+        """Release the held database connection, restoring its per-connection pragmas first"""
+        if self._conn is not None:
+            if self._restore_pragmas:
+                cursor = self._conn.cursor()
+                for name, value in self._restore_pragmas:
+                    cursor.execute(f"PRAGMA {name}={value}")
+                self._restore_pragmas = []
+            self._conn.close()
+            self._conn = None
+    
+    def _ensure_lead_identifier_index(self):
+        """
+        Make sure the lead identifier query can be answered from a covering index
+        (ghl_contact_id, customer_email, ghl_opportunity_id, id) instead of the table rows.
+        """
+        if EnhancedDatabaseSync._lead_identifier_index_ready:
+            return
+        
+        try:
+            conn = self._connection()
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_leads_ghl_identifiers
+                ON leads(ghl_contact_id, customer_email, ghl_opportunity_id, id)
+            """)
+            conn.commit()
+            EnhancedDatabaseSync._lead_identifier_index_ready = True
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Could not verify lead identifier index: {e}")
+    
     def sync_all(self) -> Dict[str, Any]:
         """
         Complete bi-directional sync process:
@@ -116,25 +360,37 @@ class EnhancedDatabaseSync:
             logger.info(f"DEBUG GHL location_api_key (last 8): ...{_loc_key[-8:]}" if len(_loc_key) >= 8 else "DEBUG GHL location_api_key: (set)")
         
         start_time = datetime.now()
+        self._account_loaded = False
         
         try:
-            # Step 1: Get ALL vendor contacts from GHL
-            logger.info("\n📊 STEP 1: Fetching ALL vendor contacts from GHL")
-            ghl_vendors = self._fetch_all_ghl_vendors()
+            self._ensure_lead_identifier_index()
             
-            # Step 2: Get ALL local vendors
-            logger.info("\n📊 STEP 2: Fetching local vendor records")
-            local_vendors = self._get_local_vendors()
+            # Step 1: Read local vendors once (used for GHL matching and the sync itself)
+            logger.info("\n📊 STEP 1: Fetching local vendor records")
+            local_vendors, vendor_identifiers = self._load_vendor_snapshot()
             
-            # Step 3: Process sync
-            logger.info("\n📊 STEP 3: Processing bi-directional sync")
-            self._process_vendor_sync(ghl_vendors, local_vendors)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # The lead fetch (step 4) is independent of the vendor sync - start it now
+                # so its GHL round trips overlap steps 2-3; _pace_ghl_request spaces every
+                # GHL request from both threads, including the contact list scan pages
+                ghl_leads_future = executor.submit(self._fetch_all_ghl_leads)
+                
+                # Step 2: Get ALL vendor contacts from GHL
+                logger.info("\n📊 STEP 2: Fetching ALL vendor contacts from GHL")
+                ghl_vendors = self._fetch_all_ghl_vendors(vendor_identifiers)
+                
+                # Step 3: Process sync
+                logger.info("\n📊 STEP 3: Processing bi-directional sync")
+                self._process_vendor_sync(ghl_vendors, local_vendors)
+                self.close()
+                
+                # Step 4: Process lead sync - read the local leads while the
+                # lead fetch may still be waiting on GHL, then join it
+                logger.info("\n📊 STEP 4: Processing lead sync")
+                local_leads = self._get_local_leads()
+                ghl_leads = ghl_leads_future.result()
             
-            # Step 4: Process lead sync
-            logger.info("\n📊 STEP 4: Processing lead sync")
-            ghl_leads = self._fetch_all_ghl_leads()
-            local_leads = self._get_local_leads()
-            self._process_lead_sync(ghl_leads, local_leads)
+            self._process_lead_sync(ghl_leads, *local_leads)
             
             duration = (datetime.now() - start_time).total_seconds()
             
@@ -182,34 +438,23 @@ class EnhancedDatabaseSync:
                 'stats': self.stats,
                 'error': str(e)
             }
+        finally:
+            self.close()
     
-    def _fetch_all_ghl_vendors(self) -> Dict[str, Dict]:
+    def _fetch_all_ghl_vendors(self, local_vendor_identifiers: Dict[str, Dict]) -> Dict[str, Dict]:
         """
         Fetch vendor contacts from GHL by matching with local vendor database
+        (identifiers from _load_vendor_snapshot).
         Returns dict keyed by contact ID for fast lookup
         """
         all_vendors = {}
+        # Identifiers GHL could not be checked for; _process_vendor_sync won't flag their vendors
+        self._unresolved_vendor_identifiers = set()
         
         try:
-            # First, get all local vendor GHL contact IDs and emails
-            conn = simple_db_instance._get_raw_conn()
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT ghl_contact_id, email, name 
-                FROM vendors 
-                WHERE ghl_contact_id IS NOT NULL OR email IS NOT NULL
-            """)
-            
-            local_vendor_contact_ids = set()
-            local_vendor_identifiers = {}
-            for row in cursor.fetchall():
-                if row[0]:  # Has GHL contact ID
-                    local_vendor_contact_ids.add(row[0])
-                    local_vendor_identifiers[row[0]] = {'type': 'contact_id', 'name': row[2]}
-                if row[1]:  # Has email
-                    local_vendor_identifiers[row[1].lower()] = {'type': 'email', 'name': row[2]}
-            
-            conn.close()
+            local_vendor_contact_ids = {
+                key for key, match in local_vendor_identifiers.items() if match['type'] == 'contact_id'
+            }
             
             logger.info(f"   Found {len(local_vendor_identifiers)} vendor identifiers to match ({len(local_vendor_contact_ids)} with GHL contact ID)")
             
@@ -218,51 +463,56 @@ class EnhancedDatabaseSync:
             if local_vendor_contact_ids:
                 logger.info(f"   Fetching {len(local_vendor_contact_ids)} vendor contacts by ID from GHL...")
                 for contact_id in local_vendor_contact_ids:
+                    self._pace_ghl_request()
                     try:
                         contact = self.ghl_api.get_contact_by_id(contact_id, location_id=loc_id)
                         if contact:
                             all_vendors[contact_id] = contact
                     except Exception as e:
-                        logger.debug(f"   Could not fetch vendor contact {contact_id}: {e}")
-                    time.sleep(0.12)
+                        logger.debug("   Could not fetch vendor contact %s: %s", contact_id, e)
                 logger.info(f"   Found {len(all_vendors)} vendors via fetch-by-ID")
-            
-            # Step 2: Batch-scan GHL contacts to match by email (vendors without ghl_contact_id or as fallback)
-            limit = 100
-            offset = 0
+                
+                # Retry IDs the direct GET missed (e.g. a transient error) with batched id searches
+                ids_unfetched = sorted(local_vendor_contact_ids.difference(all_vendors))
+                for start in range(0, len(ids_unfetched), GHL_SEARCH_BATCH_SIZE):
+                    batch = ids_unfetched[start:start + GHL_SEARCH_BATCH_SIZE]
+                    self._pace_ghl_request()
+                    for contact in self.ghl_api.search_contacts_by_values('id', batch, location_id=loc_id):
+                        if contact.get('id') in local_vendor_contact_ids:
+                            all_vendors[contact['id']] = contact
+                if ids_unfetched:
+                    logger.info(f"   Found {len(all_vendors)} vendors after retrying {len(ids_unfetched)} IDs via id search")
+            
+            # Step 2: Search the remaining vendor emails server-side, GHL_SEARCH_BATCH_SIZE per request
+            emails_found = {(c.get('email') or '').lower() for c in all_vendors.values() if c.get('email')}
+            emails_needed = sorted(
+                key for key, match in local_vendor_identifiers.items()
+                if match['type'] == 'email' and key not in emails_found
+            )
+            if emails_needed:
+                logger.info(f"   Searching {len(emails_needed)} vendor emails in GHL (POST /contacts/search)...")
+                for start in range(0, len(emails_needed), GHL_SEARCH_BATCH_SIZE):
+                    batch = emails_needed[start:start + GHL_SEARCH_BATCH_SIZE]
+                    self._pace_ghl_request()
+                    for contact in self.ghl_api.search_contacts_by_values('email', batch, location_id=loc_id):
+                        contact_email = (contact.get('email') or '').lower()
+                        # Only keep exact matches for emails we asked for
+                        if contact.get('id') and contact_email in local_vendor_identifiers:
+                            all_vendors[contact['id']] = contact
+                            emails_found.add(contact_email)
+                emails_needed = [email for email in emails_needed if email not in emails_found]
+                logger.info(f"   Found {len(all_vendors)} vendors after email search ({len(emails_needed)} emails unmatched)")
+            
+            # Step 3: Batch-scan GHL contacts only if some vendor emails or contact IDs are still
+            # unmatched (search_contacts_by_values reports errors as no match, so a missing ID
+            # still gets the list fallback), stopping once every outstanding identifier is seen
             matched_count = len(all_vendors)
             total_fetched = 0
+            remaining_ids = set(emails_needed)
+            remaining_ids.update(local_vendor_contact_ids.difference(all_vendors))
             
-            while True:
-                logger.info(f"   Fetching GHL contacts (offset: {offset}, limit: {limit})")
-                
-                params = {
-                    'locationId': self.ghl_api.location_id,
-                    'limit': limit,
-                    'skip': offset,
-                }
-                
-                # Make API call
-                url = f"{self.ghl_api.v2_base_url}/contacts/"
-                headers = {
-                    "Authorization": f"Bearer {self.ghl_api.private_token}",
-                    "Version": "2021-07-28"
-                }
-                
-                import requests
-                response = requests.get(url, headers=headers, params=params)
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ Failed to fetch GHL contacts: {response.status_code}")
-                    break
-                
-                data = response.json()
-                contacts = data.get('contacts', [])
-                
-                if not contacts:
-                    logger.info(f"   No more contacts to fetch")
-                    break
-                
+            self._contact_scan_failed = False
+            for contacts in (self._iter_ghl_contact_pages() if remaining_ids else ()):
                 # Process each contact
                 for contact in contacts:
                     contact_id = contact.get('id')
@@ -276,27 +526,32 @@ class EnhancedDatabaseSync:
                     if contact_id in local_vendor_identifiers:
                         is_vendor = True
                         vendor_match = local_vendor_identifiers[contact_id]
-                        logger.debug(f"   Matched vendor by contact ID: {vendor_match['name']}")
+                        logger.debug("   Matched vendor by contact ID: %s", vendor_match['name'])
                     
                     # Priority 2: Match by email
                     elif contact_email and contact_email in local_vendor_identifiers:
                         is_vendor = True
                         vendor_match = local_vendor_identifiers[contact_email]
-                        logger.debug(f"   Matched vendor by email: {vendor_match['name']}")
+                        logger.debug("   Matched vendor by email: %s", vendor_match['name'])
                     
                     if is_vendor:
                         all_vendors[contact_id] = contact
                         matched_count += 1
+                        remaining_ids.discard(contact_id)
+                        remaining_ids.discard(contact_email)
                 
                 total_fetched += len(contacts)
                 self.stats['ghl_contacts_fetched'] = total_fetched
                 
-                # Check if we got all contacts
-                if len(contacts) < limit:
+                if not remaining_ids:
+                    logger.info(f"   All vendor identifiers matched after {total_fetched} contacts - stopping scan")
                     break
-                
-                offset += limit
-                time.sleep(0.2)  # Rate limiting
+            
+            if remaining_ids and self._contact_scan_failed:
+                # The scan never saw the rest of the list, so these vendors may still be in GHL
+                logger.warning(f"⚠️  GHL contact scan stopped on a failed page - not flagging "
+                               f"{len(remaining_ids)} unmatched vendor identifiers as missing")
+                self._unresolved_vendor_identifiers = set(remaining_ids)
             
             logger.info(f"✅ Fetched {len(all_vendors)} vendor contacts from GHL")
             return all_vendors
@@ -306,78 +561,211 @@ class EnhancedDatabaseSync:
             self.stats['errors'].append(f"GHL fetch error: {str(e)}")
             return {}
     
-    def _get_local_vendors(self) -> Dict[str, Dict]:
+    def _fetch_ghl_contacts_page(self, offset: int, limit: int = GHL_PAGE_LIMIT) -> Optional[Dict]:
+        """GET one page of GHL contacts (paced like every other GHL request); returns the response JSON or None on failure"""
+        self._pace_ghl_request()
+        logger.info(f"   Fetching GHL contacts (offset: {offset}, limit: {limit})")
+        
+        params = {
+            'locationId': self.ghl_api.location_id,
+            'limit': limit,
+            'skip': offset,
+        }
+        url = f"{self.ghl_api.v2_base_url}/contacts/"
+        try:
+            response = self._http.get(url, params=params, timeout=30)
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch GHL contacts: {e}")
+            return None
+        
+        if response.status_code != 200:
+            logger.error(f"❌ Failed to fetch GHL contacts: {response.status_code}")
+            return None
+        
+        return response.json()
+    
+    def _iter_ghl_contact_pages(self, limit: int = GHL_PAGE_LIMIT):
         """
-        Get all local vendors - returns tuple of:
-        1. Dict keyed by GHL contact ID
-        2. Dict keyed by email (for vendors without GHL ID)
+        Yield pages (lists) of GHL contacts in offset order.
+        The first page reports the total; the remaining pages are then requested
+        GHL_PAGE_FETCH_WORKERS at a time instead of one after another.
+        Sets self._contact_scan_failed when the scan stopped on a failed page rather
+        than past the end of the list.
+        """
+        self._contact_scan_failed = False
+        data = self._fetch_ghl_contacts_page(0, limit)
+        if not data:
+            self._contact_scan_failed = True
+            return
+        
+        contacts = data.get('contacts', [])
+        if not contacts:
+            logger.info(f"   No more contacts to fetch")
+            return
+        yield contacts
+        
+        total = (data.get('meta') or {}).get('total')
+        if len(contacts) < limit:
+            return
+        
+        if not total:
+            # Total unknown - fall back to sequential paging
+            offset = limit
+            while True:
+                data = self._fetch_ghl_contacts_page(offset, limit)
+                if data is None:
+                    self._contact_scan_failed = True
+                    return
+                contacts = data.get('contacts', [])
+                if not contacts:
+                    return
+                yield contacts
+                if len(contacts) < limit:
+                    return
+                offset += limit
+        
+        offsets = list(range(limit, total, limit))
+        with ThreadPoolExecutor(max_workers=GHL_PAGE_FETCH_WORKERS) as executor:
+            for wave_start in range(0, len(offsets), GHL_PAGE_FETCH_WORKERS):
+                wave = offsets[wave_start:wave_start + GHL_PAGE_FETCH_WORKERS]
+                pages = list(executor.map(lambda offset: self._fetch_ghl_contacts_page(offset, limit), wave))
+                
+                for data in pages:
+                    if data is None:
+                        self._contact_scan_failed = True
+                        return
+                    contacts = data.get('contacts', [])
+                    if not contacts:
+                        # Past the end - stop like the sequential scan did
+                        return
+                    yield contacts
+    
+    def _load_vendor_snapshot(self) -> Tuple[VendorTable, Dict[str, Dict]]:
         """
-        local_vendors_by_ghl_id = {}
-        local_vendors_by_email = {}
+        Read the vendor keys (id, name, email, GHL contact ID) once - returns tuple of:
+        1. VendorTable with row lookups by GHL contact ID and by email (for vendors without GHL ID)
+        2. Identifier lookup for GHL matching: contact ID / lowercased email ->
+           {'type': 'contact_id' | 'email', 'name': ...}
+        The remaining columns are loaded by _load_vendor_details for matched vendors only.
+        """
+        table = VendorTable()
+        vendor_identifiers = {}
         
         try:
-            vendors = simple_db_instance.get_vendors()
+            conn = self._connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, name, email, ghl_contact_id FROM vendors")
             
-            for vendor in vendors:
-                ghl_contact_id = vendor.get('ghl_contact_id')
-                email = vendor.get('email', '').lower()
-                
+            for vendor_id, name, email, ghl_contact_id in cursor.fetchall():
+                table.append(vendor_id, name, email, ghl_contact_id)
                 if ghl_contact_id:
-                    local_vendors_by_ghl_id[ghl_contact_id] = vendor
-                elif email:  # No GHL ID but has email
-                    local_vendors_by_email[email] = vendor
+                    vendor_identifiers[ghl_contact_id] = {'type': 'contact_id', 'name': name}
+                if email:
+                    vendor_identifiers[email.lower()] = {'type': 'email', 'name': name}
             
-            logger.info(f"✅ Found {len(local_vendors_by_ghl_id)} vendors with GHL IDs")
-            logger.info(f"   Found {len(local_vendors_by_email)} vendors without GHL IDs (by email)")
+            logger.info(f"✅ Found {len(table.by_ghl_id)} vendors with GHL IDs")
+            logger.info(f"   Found {len(table.by_email)} vendors without GHL IDs (by email)")
             
-            return local_vendors_by_ghl_id, local_vendors_by_email
+            return table, vendor_identifiers
             
         except Exception as e:
             logger.error(f"❌ Error fetching local vendors: {e}")
             self.stats['errors'].append(f"Local fetch error: {str(e)}")
-            return {}, {}
+            return VendorTable(), {}
+    
+    def _load_vendor_details(self, vendors: List[Dict]) -> bool:
+        """Fill in _VENDOR_DETAIL_COLUMNS on the given snapshot vendors with batched id IN (...) reads"""
+        by_id = {vendor['id']: vendor for vendor in vendors}
+        if not by_id:
+            return True
+        
+        columns = self._VENDOR_DETAIL_COLUMNS
+        vendor_ids = list(by_id)
+        
+        try:
+            conn = self._connection()
+            cursor = conn.cursor()
+            for start in range(0, len(vendor_ids), SQL_IN_BATCH_SIZE):
+                batch = vendor_ids[start:start + SQL_IN_BATCH_SIZE]
+                placeholders = ', '.join('?' * len(batch))
+                cursor.execute(
+                    f"SELECT id, {', '.join(columns)} FROM vendors WHERE id IN ({placeholders})",
+                    batch
+                )
+                for row in cursor.fetchall():
+                    vendor = by_id[row[0]]
+                    vendor.update(zip(columns, row[1:]))
+                    vendor['_list_sets'] = {
+                        field: self._parse_list_set(vendor[field]) for field in self._LIST_FIELDS
+                    }
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Error loading vendor details: {e}")
+            self.stats['errors'].append(f"Local fetch error: {str(e)}")
+            return False
     
-    def _process_vendor_sync(self, ghl_vendors: Dict, local_vendors_tuple: tuple):
+    @staticmethod
+    def _parse_list_set(value: Optional[str]) -> Optional[frozenset]:
+        """Stored JSON list -> frozenset of its items, or None if it does not parse"""
+        try:
+            return frozenset(json.loads(value) if value else [])
+        except (ValueError, TypeError):
+            return None
+    
+    def _process_vendor_sync(self, ghl_vendors: Dict, local_vendors: VendorTable):
         """
         Process the bi-directional sync:
         1. Update existing vendors
         2. Create new vendors from GHL
         3. Handle deleted vendors
         """
-        local_vendors_by_ghl_id, local_vendors_by_email = local_vendors_tuple
-        
-        # Track processed vendor IDs (local DB IDs)
-        processed_vendor_ids = set()
+        # Track processed vendor rows (VendorTable indices)
+        processed_rows = set()
+        matched_pairs = []
         
         # PART 1: Process vendors that exist in GHL
         for ghl_id, ghl_contact in ghl_vendors.items():
             contact_email = ghl_contact.get('email', '').lower()
-            matched_vendor = None
             
             # Try to match by GHL contact ID first
-            if ghl_id in local_vendors_by_ghl_id:
-                matched_vendor = local_vendors_by_ghl_id[ghl_id]
+            row_idx = local_vendors.by_ghl_id.get(ghl_id)
             # If no match by ID, try email
-            elif contact_email and contact_email in local_vendors_by_email:
-                matched_vendor = local_vendors_by_email[contact_email]
-                # Important: Update the vendor with the GHL contact ID
-                logger.info(f"   Matched vendor by email, adding GHL contact ID: {ghl_id}")
-            
-            if matched_vendor:
-                # UPDATE existing vendor
-                processed_vendor_ids.add(matched_vendor['id'])
+            if row_idx is None and contact_email:
+                row_idx = local_vendors.by_email.get(contact_email)
+                if row_idx is not None:
+                    # Important: Update the vendor with the GHL contact ID
+                    logger.info(f"   Matched vendor by email, adding GHL contact ID: {ghl_id}")
+            
+            if row_idx is not None:
+                # UPDATE existing vendor (after its full row is loaded below)
+                processed_rows.add(row_idx)
+                matched_vendor = local_vendors.row(row_idx)
                 # Ensure GHL contact ID is set
                 if not matched_vendor.get('ghl_contact_id'):
                     matched_vendor['ghl_contact_id'] = ghl_id
-                self._update_local_vendor(matched_vendor, ghl_contact)
+                matched_pairs.append((matched_vendor, ghl_contact))
             else:
                 # CREATE new vendor in local DB (shouldn't happen if our matching works)
                 logger.warning(f"   Creating new vendor - not found by ID or email: {ghl_contact.get('email')}")
                 self._create_local_vendor(ghl_contact)
         
+        if self._load_vendor_details([vendor for vendor, _ in matched_pairs]):
+            for matched_vendor, ghl_contact in matched_pairs:
+                self._update_local_vendor(matched_vendor, ghl_contact)
+        else:
+            logger.warning("⚠️  Skipping vendor updates - local vendor details could not be loaded")
+        
         # PART 2: Handle vendors that exist locally but not in GHL (deleted/missing)
-        all_local_vendors = list(local_vendors_by_ghl_id.values()) + list(local_vendors_by_email.values())
-        missing_vendors = [v for v in all_local_vendors if v['id'] not in processed_vendor_ids]
+        indexed_rows = list(local_vendors.by_ghl_id.values()) + list(local_vendors.by_email.values())
+        missing_vendors = [local_vendors.row(idx) for idx in indexed_rows if idx not in processed_rows]
+        unresolved = self._unresolved_vendor_identifiers
+        if unresolved:
+            missing_vendors = [
+                vendor for vendor in missing_vendors
+                if vendor.get('ghl_contact_id') not in unresolved
+                and (vendor.get('email') or '').lower() not in unresolved
+            ]
         
         if missing_vendors:
             logger.info(f"📊 Found {len(missing_vendors)} vendors not in GHL sync results")
@@ -386,6 +774,10 @@ class EnhancedDatabaseSync:
             # Flag all missing vendors for review (not deleting)
             for local_vendor in missing_vendors:
                 self._handle_missing_ghl_vendor(local_vendor)
+        
+        # Write all buffered new vendors and vendor updates
+        self._flush_new_vendors()
+        self._flush_vendor_updates()
     
     def _update_local_vendor(self, local_vendor: Dict, ghl_contact: Dict):
         """Update existing local vendor with ALL GHL data fields"""
@@ -398,10 +790,9 @@ class EnhancedDatabaseSync:
                 logger.info(f"   Setting GHL contact ID: {ghl_contact.get('id')}")
             
             if updates:
-                success = self._update_vendor_record(local_vendor['id'], updates)
-                if success:
-                    self.stats['vendors_updated'] += 1
-                    logger.info(f"✅ Updated vendor: {local_vendor.get('name')} ({len(updates)} fields)")
+                # vendors_updated is counted by _flush_vendor_updates once the row is written
+                if self._update_vendor_record(local_vendor['id'], updates, stat='vendors_updated'):
+                    logger.info(f"✅ Queued vendor update: {local_vendor.get('name')} ({len(updates)} fields)")
             
         except Exception as e:
             logger.error(f"❌ Error updating vendor {local_vendor.get('id')}: {e}")
@@ -412,12 +803,13 @@ class EnhancedDatabaseSync:
         updates = {}
         
         # Extract custom fields from GHL contact
-        custom_fields = {}
-        for field in ghl_contact.get('customFields', []):
-            field_id = field.get('id', '')
-            field_value = field.get('value', '') or field.get('fieldValue', '')
-            if field_id:
-                custom_fields[field_id] = field_value
+        # Only keep the fields VENDOR_GHL_FIELDS actually reads
+        needed_ids = self._NEEDED_FIELD_IDS
+        custom_fields = {
+            f['id']: (f.get('value') or f.get('fieldValue') or '')
+            for f in ghl_contact.get('customFields', ())
+            if f.get('id') in needed_ids
+        }
         
         # Check for GHL User ID and set if found
         ghl_user_id_from_contact = custom_fields.get('HXVNT4y8OynNokWAfO2D', '').strip()
@@ -439,70 +831,77 @@ class EnhancedDatabaseSync:
         # Process service_zip_codes to derive coverage fields
         service_zip_codes_value = custom_fields.get('yDcN0FmwI3xacyxAuTWs', '').strip()
         if service_zip_codes_value:
-            coverage_info = self._parse_coverage_from_zip_codes(service_zip_codes_value)
-            if coverage_info['type']:
-                if vendor.get('coverage_type') != coverage_info['type']:
-                    updates['coverage_type'] = coverage_info['type']
-                if coverage_info['states']:
-                    updates['coverage_states'] = json.dumps(coverage_info['states'])
-                if coverage_info['counties']:
-                    updates['coverage_counties'] = json.dumps(coverage_info['counties'])
+            coverage_type, coverage_states, coverage_counties = self._parse_coverage_from_zip_codes(service_zip_codes_value)
+            if coverage_type:
+                if vendor.get('coverage_type') != coverage_type:
+                    updates['coverage_type'] = coverage_type
+                if coverage_states:
+                    updates['coverage_states'] = json.dumps(coverage_states)
+                if coverage_counties:
+                    updates['coverage_counties'] = json.dumps(coverage_counties)
         
-        # Check each mapped field
-        for db_field, ghl_field in self.VENDOR_GHL_FIELDS.items():
-            if db_field == 'service_zip_codes':
-                continue
-                
+        # Check each mapped field (per-field logging only when INFO is enabled)
+        log_info = logger.isEnabledFor(logging.INFO)
+        list_sets = vendor.get('_list_sets') or {}
+        for db_field, source, ghl_field, post in self._VENDOR_FIELD_PLAN:
             current_value = vendor.get(db_field)
             new_value = None
             
-            if db_field == 'name' and ghl_field == ['firstName', 'lastName']:
-                first = ghl_contact.get('firstName', '').strip()
-                last = ghl_contact.get('lastName', '').strip()
-                new_value = f"{first} {last}".strip()
-            elif ghl_field in ['email', 'phone']:
-                new_value = ghl_contact.get(ghl_field, '').strip()
-            elif isinstance(ghl_field, list):
-                for field_id in ghl_field:
-                    temp_value = custom_fields.get(field_id, '').strip()
-                    if temp_value:
-                        new_value = temp_value
-                        break
-            else:
+            if source == 'custom':
                 # Handle both string and numeric values from GHL
                 raw_value = custom_fields.get(ghl_field, '')
                 if isinstance(raw_value, str):
                     new_value = raw_value.strip()
                 else:
                     new_value = str(raw_value) if raw_value else ''
+            elif source == 'first_custom':
+                for field_id in ghl_field:
+                    temp_value = custom_fields.get(field_id, '').strip()
+                    if temp_value:
+                        new_value = temp_value
+                        break
+            elif source == 'standard':
+                new_value = ghl_contact.get(ghl_field, '').strip()
+            else:
+                first = ghl_contact.get('firstName', '').strip()
+                last = ghl_contact.get('lastName', '').strip()
+                new_value = f"{first} {last}".strip()
             
             # Special handling for certain fields
-            if db_field in ['service_categories', 'services_offered']:
+            if post is None:
+                pass
+            elif post == 'list':
                 if new_value:
                     parsed_list = [s.strip() for s in new_value.split(',') if s.strip()]
-                    new_value = json.dumps(parsed_list)
-            elif db_field == 'lead_close_percentage':
+                    # Canonical form: stable across syncs, so an unchanged list matches byte-for-byte
+                    new_value = json.dumps(sorted(parsed_list), separators=(',', ':'))
+                    if new_value == current_value:
+                        continue
+            elif post == 'percentage':
                 if new_value:
                     try:
                         # Log the raw value from GHL
-                        logger.info(f"   📊 Processing lead_close_percentage: raw value = '{new_value}'")
+                        if log_info:
+                            logger.info(f"   📊 Processing lead_close_percentage: raw value = '{new_value}'")
                         new_value = float(new_value.replace('%', '').strip())
-                        logger.info(f"   📊 Parsed lead_close_percentage: {new_value}")
+                        if log_info:
+                            logger.info(f"   📊 Parsed lead_close_percentage: {new_value}")
                     except Exception as e:
                         logger.warning(f"   ⚠️ Failed to parse lead_close_percentage '{new_value}': {e}")
                         new_value = 0.0
                 else:
-                    logger.info(f"   📊 No lead_close_percentage value from GHL")
+                    if log_info:
+                        logger.info(f"   📊 No lead_close_percentage value from GHL")
                     new_value = 0.0
-            elif db_field == 'taking_new_work':
+            elif post == 'yes_no':
                 if new_value:
-                    normalized = new_value.strip().lower()
-                    new_value = 'Yes' if normalized in ['yes', 'true', '1'] else 'No'
+                    new_value = 'Yes' if new_value.strip().lower() in self._TRUTHY else 'No'
             
             # Compare and add to updates if different
-            if new_value and self._values_differ(current_value, new_value, db_field):
+            if new_value and self._values_differ(current_value, new_value, db_field, list_sets.get(db_field)):
                 updates[db_field] = new_value
-                logger.info(f"   🔄 Field '{db_field}' will update: '{current_value}' → '{new_value}'")
+                if log_info:
+                    logger.info(f"   🔄 Field '{db_field}' will update: '{current_value}' → '{new_value}'")
         
         if updates:
             logger.info(f"   📝 Total updates to apply: {len(updates)} fields")
@@ -511,49 +910,54 @@ class EnhancedDatabaseSync:
         
         return updates
     
-    def _parse_coverage_from_zip_codes(self, service_zip_codes_value: str) -> Dict:
-        """Parse service_zip_codes field to determine coverage type"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_coverage_from_zip_codes(service_zip_codes_value: str) -> Tuple[Optional[str], Optional[tuple], Optional[tuple]]:
+        """Parse service_zip_codes field to determine coverage type.
+
+        Returns an immutable (type, states, counties) tuple so results can be
+        cached across vendors that share the same coverage string.
+        """
         normalized_value = service_zip_codes_value.upper().strip()
         
         if 'GLOBAL' in normalized_value:
-            return {'type': 'global', 'states': [], 'counties': []}
+            return 'global', (), ()
         elif 'NATIONAL' in normalized_value or normalized_value in ['USA', 'UNITED STATES']:
-            return {'type': 'national', 'states': [], 'counties': []}
+            return 'national', (), ()
         elif ';' in service_zip_codes_value:
             items = [s.strip() for s in service_zip_codes_value.split(';') if s.strip()]
             if items and ', ' in items[0]:
-                counties = items
-                states = list({county.split(', ')[-1].strip() for county in counties if ', ' in county})
-                return {'type': 'county', 'states': states, 'counties': counties}
+                counties = tuple(items)
+                states = tuple({county.split(', ')[-1].strip() for county in counties if ', ' in county})
+                return 'county', states, counties
         elif ',' in service_zip_codes_value:
             items = [s.strip() for s in service_zip_codes_value.split(',') if s.strip()]
             if all(len(item) == 2 and item.isupper() for item in items):
-                return {'type': 'state', 'states': items, 'counties': []}
+                return 'state', tuple(items), ()
         
-        return {'type': None, 'states': None, 'counties': None}
+        return None, None, None
     
     def _get_vendor_status_from_tags(self, ghl_contact: Dict) -> str:
         """Determine vendor status from GHL contact tags: 'manually approved' -> active, else -> pending"""
         tags_raw = ghl_contact.get('tags') or []
         if isinstance(tags_raw, str):
-            tags_list = [t.strip().lower() for t in tags_raw.split(',') if t.strip()]
-        elif isinstance(tags_raw, list):
-            tags_list = []
-            for t in tags_raw:
-                if isinstance(t, str):
-                    tags_list.append(t.strip().lower())
-                elif isinstance(t, dict):
-                    tag_name = (t.get('name') or t.get('tag') or '').strip().lower()
-                    if tag_name:
-                        tags_list.append(tag_name)
-                else:
-                    tags_list.append(str(t).strip().lower())
-        else:
-            tags_list = []
-        return "active" if "manually approved" in tags_list else "pending"
+            tags_raw = tags_raw.split(',')
+        elif not isinstance(tags_raw, list):
+            return "pending"
+        for t in tags_raw:
+            if isinstance(t, str):
+                tag_name = t
+            elif isinstance(t, dict):
+                tag_name = t.get('name') or t.get('tag') or ''
+            else:
+                tag_name = str(t)
+            if tag_name.strip().lower() == self._APPROVED_TAG:
+                return "active"
+        return "pending"
 
-    def _values_differ(self, current: Any, new: Any, field_name: str) -> bool:
-        """Check if two values are different"""
+    def _values_differ(self, current: Any, new: Any, field_name: str,
+                       current_set: Optional[frozenset] = None) -> bool:
+        """Check if two values are different (current_set: pre-parsed current list, if known)"""
         if current is None and new == '':
             return False
         if current == '' and new is None:
@@ -561,62 +965,107 @@ class EnhancedDatabaseSync:
         
         if field_name in ['service_categories', 'services_offered', 'coverage_states', 'coverage_counties']:
             try:
-                current_list = json.loads(current) if current else []
                 new_list = json.loads(new) if new else []
+                if current_set is not None:
+                    return current_set != frozenset(new_list)
+                current_list = json.loads(current) if current else []
                 return set(current_list) != set(new_list)
             except:
                 return str(current) != str(new)
         
-        return str(current or '').strip() != str(new or '').strip()
+        current_str = str(current or '').strip()
+        new_str = str(new or '').strip()
+        if len(current_str) != len(new_str):
+            return True
+        return current_str != new_str
+    
+    def _get_location_account(self) -> Optional[Dict]:
+        """Return the account for the configured GHL location, read once per sync"""
+        if not self._account_loaded:
+            self._account = simple_db_instance.get_account_by_ghl_location_id(
+                os.getenv('GHL_LOCATION_ID') or AppConfig.GHL_LOCATION_ID
+            )
+            self._account_loaded = True
+        return self._account
     
     def _create_local_vendor(self, ghl_contact: Dict):
-        """Create new vendor in local DB from GHL contact"""
+        """Queue a new vendor from a GHL contact; rows are inserted by _flush_new_vendors"""
         try:
             # Extract custom fields
             custom_fields = {cf['id']: cf.get('value', '') 
                            for cf in ghl_contact.get('customFields', [])}
             
             # Get account ID
-            account = simple_db_instance.get_account_by_ghl_location_id(
-                os.getenv('GHL_LOCATION_ID') or AppConfig.GHL_LOCATION_ID
-            )
+            account = self._get_location_account()
             if not account:
                 logger.error("❌ No account found for location")
                 return
             
-            # Create vendor data - status from tags: "manually approved" -> active, else -> pending
+            # Status from tags: "manually approved" -> active, else -> pending
             tag_based_status = self._get_vendor_status_from_tags(ghl_contact)
-            vendor_data = {
-                'account_id': account['id'],
-                'ghl_contact_id': ghl_contact.get('id'),
-                'ghl_user_id': custom_fields.get('HXVNT4y8OynNokWAfO2D', ''),
-                'name': f"{ghl_contact.get('firstName', '')} {ghl_contact.get('lastName', '')}".strip(),
-                'email': ghl_contact.get('email', ''),
-                'phone': ghl_contact.get('phone', ''),
-                'company_name': custom_fields.get('JexVrg2VNhnwIX7YlyJV', ''),
-                'status': tag_based_status,
-                # Add other fields...
-            }
-            
-            # Create vendor in database (create_vendor expects positional/keyword args, not a dict)
-            vendor_id = simple_db_instance.create_vendor(
-                account_id=vendor_data['account_id'],
-                name=vendor_data['name'],
-                email=vendor_data['email'],
-                company_name=vendor_data.get('company_name', ''),
-                phone=vendor_data.get('phone', ''),
-                ghl_contact_id=vendor_data.get('ghl_contact_id'),
-                status=vendor_data.get('status', 'pending'),
-                taking_new_work=vendor_data.get('taking_new_work', True),
-            )
-            if vendor_id:
-                self.stats['vendors_created'] += 1
-                logger.info(f"✅ Created NEW vendor from GHL: {vendor_data['name']}")
+            name = f"{ghl_contact.get('firstName', '')} {ghl_contact.get('lastName', '')}".strip()
+            
+            # Same values simple_db_instance.create_vendor writes, in _NEW_VENDOR_COLUMNS order
+            self._pending_new_vendors.append((
+                str(uuid.uuid4()),
+                account['id'],
+                name,
+                custom_fields.get('JexVrg2VNhnwIX7YlyJV', ''),
+                ghl_contact.get('email', ''),
+                ghl_contact.get('phone', ''),
+                ghl_contact.get('id'),
+                tag_based_status,
+                '', '', 'county', '', '',
+                True,
+            ))
+            logger.info(f"   Queued NEW vendor from GHL: {name}")
             
         except Exception as e:
             logger.error(f"❌ Error creating vendor from GHL: {e}")
             self.stats['errors'].append(f"Create error: {str(e)}")
     
+    def _insert_vendors(self, rows: List[tuple]):
+        """INSERT vendor rows with one executemany, in one transaction. Rolls back and raises on error."""
+        columns = self._NEW_VENDOR_COLUMNS
+        conn = self._connection()
+        try:
+            conn.cursor().executemany(
+                f"INSERT INTO vendors ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                rows
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        self.stats['vendors_created'] += len(rows)
+    
+    def _flush_new_vendors(self) -> bool:
+        """Insert all queued new vendors in one batch; if the batch fails, retry each row on its own"""
+        if not self._pending_new_vendors:
+            return True
+        
+        rows = self._pending_new_vendors
+        self._pending_new_vendors = []
+        
+        try:
+            self._insert_vendors(rows)
+            logger.info(f"✅ Created {len(rows)} NEW vendors from GHL")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Batched vendor insert failed, retrying row by row: {e}")
+        
+        # One bad row (e.g. a ghl_contact_id UNIQUE conflict) only skips that vendor
+        all_created = True
+        for row in rows:
+            try:
+                self._insert_vendors([row])
+                logger.info(f"✅ Created NEW vendor from GHL: {row[4]}")
+            except Exception as e:
+                all_created = False
+                logger.error(f"❌ Error creating vendor from GHL ({row[4]}): {e}")
+                self.stats['errors'].append(f"Create error: {str(e)}")
+        return all_created
+    
     def _handle_missing_ghl_vendor(self, local_vendor: Dict):
         """
         Handle vendor that exists locally but not in GHL.
@@ -628,12 +1077,10 @@ class EnhancedDatabaseSync:
             logger.warning(f"⚠️  Vendor exists locally but not found in GHL sync: {vendor_name}")
             
             # Flag as missing instead of deleting
+            # vendors_missing_in_ghl is counted by _flush_vendor_updates once the row is written
             updates = {'status': 'missing_in_ghl'}
-            success = self._update_vendor_record(local_vendor['id'], updates)
-            
-            if success:
-                self.stats['vendors_missing_in_ghl'] = self.stats.get('vendors_missing_in_ghl', 0) + 1
-                logger.info(f"🔍 Flagged vendor as missing in GHL: {vendor_name} (admin review needed)")
+            if self._update_vendor_record(local_vendor['id'], updates, stat='vendors_missing_in_ghl'):
+                logger.info(f"🔍 Flagging vendor as missing in GHL: {vendor_name} (admin review needed)")
             
             # DO NOT auto-delete or deactivate
             # Admin will review and decide through dashboard
@@ -642,41 +1089,73 @@ class EnhancedDatabaseSync:
             logger.error(f"❌ Error handling missing vendor: {e}")
             self.stats['errors'].append(f"Missing vendor error: {str(e)}")
     
-    def _update_vendor_record(self, vendor_id: str, updates: Dict) -> bool:
-        """Update vendor in database"""
-        try:
-            if not updates:
-                return True
-            
-            # Build UPDATE query (use raw connection for cursor)
-            conn = simple_db_instance._get_raw_conn()
-            cursor = conn.cursor()
-            
-            set_clauses = []
-            values = []
-            
-            for field, value in updates.items():
-                set_clauses.append(f"{field} = ?")
-                values.append(value)
-            
+    def _update_vendor_record(self, vendor_id: str, updates: Dict, stat: Optional[str] = None) -> bool:
+        """Queue a vendor update; written by _flush_vendor_updates, which bumps self.stats[stat] on success"""
+        if not updates:
+            return True
+        
+        # Group by column set so each group shares one UPDATE statement
+        columns = tuple(sorted(updates))
+        self._pending_vendor_updates[columns].append(
+            tuple(updates[field] for field in columns) + (vendor_id,)
+        )
+        if stat:
+            self._pending_vendor_stats[vendor_id] = stat
+        return True
+    
+    def _flush_vendor_updates(self) -> bool:
+        """Write all queued vendor updates with one executemany per column set (row by row on failure)"""
+        pending, stat_keys = self._pending_vendor_updates, self._pending_vendor_stats
+        self._pending_vendor_updates = defaultdict(list)
+        self._pending_vendor_stats = {}
+        return self._write_grouped_updates('vendors', pending, stat_keys)
+    
+    def _write_grouped_updates(self, table: str, pending: Dict[tuple, List[tuple]],
+                               stat_keys: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Run one UPDATE executemany per column set in `pending` and commit once. If the batch
+        fails it is rolled back and each row is retried on its own, so one bad row only skips
+        that row. `stat_keys` maps row id -> self.stats counter bumped once the row is written.
+        """
+        if not pending:
+            return True
+        
+        queries = {}
+        for columns in pending:
+            set_clauses = [f"{field} = ?" for field in columns]
             set_clauses.append("updated_at = CURRENT_TIMESTAMP")
-            values.append(vendor_id)
-            
-            query = f"""
-                UPDATE vendors 
-                SET {', '.join(set_clauses)}
-                WHERE id = ?
-            """
-            
-            cursor.execute(query, values)
+            queries[columns] = f"UPDATE {table} SET {', '.join(set_clauses)} WHERE id = ?"
+        
+        conn = self._connection()
+        cursor = conn.cursor()
+        written: List[tuple] = []
+        try:
+            for columns, rows in pending.items():
+                cursor.executemany(queries[columns], rows)
             conn.commit()
-            conn.close()
-            
-            return True
-            
+            for rows in pending.values():
+                written.extend(rows)
+            logger.info(f"💾 Wrote {len(written)} {table} updates ({len(pending)} statements)")
         except Exception as e:
-            logger.error(f"❌ Error updating vendor {vendor_id}: {e}")
-            return False
+            conn.rollback()
+            logger.error(f"❌ Batched {table} update failed, retrying row by row: {e}")
+            for columns, rows in pending.items():
+                for row in rows:
+                    try:
+                        cursor.execute(queries[columns], row)
+                        conn.commit()
+                        written.append(row)
+                    except Exception as row_error:
+                        conn.rollback()
+                        logger.error(f"❌ Error updating {table} row {row[-1]}: {row_error}")
+                        self.stats['errors'].append(f"{table.capitalize()} update error: {str(row_error)}")
+        
+        if stat_keys:
+            for row in written:
+                stat = stat_keys.get(row[-1])
+                if stat:
+                    self.stats[stat] = self.stats.get(stat, 0) + 1
+        return len(written) == sum(len(rows) for rows in pending.values())
     
     def _fetch_all_ghl_leads(self) -> Dict[str, Dict]:
         """
@@ -693,12 +1172,18 @@ class EnhancedDatabaseSync:
         """
         all_leads = {}
         self._lead_contact_ids_fetch_failed = set()
+        conn = None
         try:
-            # Get all local lead identifiers for matching
+            # Get all local lead identifiers for matching. This runs on a worker thread
+            # alongside the vendor sync, so it keeps its own connection rather than self._conn
             conn = simple_db_instance._get_raw_conn()
             cursor = conn.cursor()
+            cursor.arraysize = LEAD_ROW_FETCH_SIZE
+            cursor.row_factory = sqlite3.Row
+            # Emails come back already lowercased; lower() runs on the covering index entries
             cursor.execute("""
-                SELECT DISTINCT ghl_contact_id, customer_email, ghl_opportunity_id, id
+                SELECT DISTINCT ghl_contact_id, lower(customer_email) AS email_lower,
+                       ghl_opportunity_id, id
                 FROM leads 
                 WHERE (ghl_contact_id IS NOT NULL AND ghl_contact_id != '')
                    OR (customer_email IS NOT NULL AND customer_email != '')
@@ -709,17 +1194,15 @@ class EnhancedDatabaseSync:
             local_lead_opportunity_ids = {}
             lead_id_map = {}  # Map to track which local lead each GHL contact matches
             
-            for row in cursor.fetchall():
-                if row[0]:  # Has GHL contact ID
-                    local_lead_contact_ids.add(row[0])
-                    lead_id_map[row[0]] = row[3]  # Map GHL ID to local lead ID
-                if row[1]:  # Has email
-                    email_lower = row[1].lower()
-                    local_lead_emails[email_lower] = row[3]  # Map email to local lead ID
-                if row[2]:  # Has GHL opportunity ID
-                    local_lead_opportunity_ids[row[2]] = row[3]  # Map opportunity ID to local lead ID
-            
-            conn.close()
+            for row in cursor:
+                lead_id = row['id']
+                if row['ghl_contact_id']:
+                    local_lead_contact_ids.add(row['ghl_contact_id'])
+                    lead_id_map[row['ghl_contact_id']] = lead_id  # Map GHL ID to local lead ID
+                if row['email_lower']:
+                    local_lead_emails[row['email_lower']] = lead_id  # Map email to local lead ID
+                if row['ghl_opportunity_id']:
+                    local_lead_opportunity_ids[row['ghl_opportunity_id']] = lead_id  # Map opportunity ID to local lead ID
             
             logger.info(f"   Found {len(local_lead_contact_ids)} leads with GHL contact IDs")
             logger.info(f"   Found {len(local_lead_emails)} leads with emails")
@@ -735,18 +1218,36 @@ class EnhancedDatabaseSync:
             if local_lead_contact_ids:
                 logger.info(f"   Fetching {len(local_lead_contact_ids)} lead contacts by ID from GHL...")
                 loc_id = getattr(self.ghl_api, 'location_id', None) or os.getenv('GHL_LOCATION_ID') or (AppConfig.GHL_LOCATION_ID if hasattr(AppConfig, 'GHL_LOCATION_ID') else None)
-                for contact_id in local_lead_contact_ids:
+                
+                # Batched id filter first, GHL_SEARCH_BATCH_SIZE IDs per POST /contacts/search
+                contact_ids = sorted(local_lead_contact_ids)
+                for start in range(0, len(contact_ids), GHL_SEARCH_BATCH_SIZE):
+                    batch = contact_ids[start:start + GHL_SEARCH_BATCH_SIZE]
+                    self._pace_ghl_request()
+                    for contact in self.ghl_api.search_contacts_by_values('id', batch, location_id=loc_id):
+                        if contact.get('id') in local_lead_contact_ids:
+                            all_leads[contact['id']] = contact
+                ids_not_in_search = [cid for cid in contact_ids if cid not in all_leads]
+                logger.info(f"   Found {len(all_leads)} leads via id search; fetching {len(ids_not_in_search)} individually")
+                
+                def fetch_one(contact_id: str) -> Tuple[str, Optional[Dict], Optional[Exception]]:
+                    self._pace_ghl_request()
                     try:
-                        contact = self.ghl_api.get_contact_by_id(contact_id, location_id=loc_id)
+                        return contact_id, self.ghl_api.get_contact_by_id(contact_id, location_id=loc_id), None
+                    except Exception as e:
+                        return contact_id, None, e
+                
+                # Requests overlap their round trips; _pace_ghl_request still spaces their starts
+                with ThreadPoolExecutor(max_workers=GHL_FETCH_BY_ID_WORKERS) as executor:
+                    for contact_id, contact, error in executor.map(fetch_one, ids_not_in_search):
                         if contact:
                             all_leads[contact_id] = contact
+                        elif error is not None:
+                            self._lead_contact_ids_fetch_failed.add(contact_id)
+                            logger.warning(f"   Could not fetch contact {contact_id}: {error}")
                         else:
                             self._lead_contact_ids_fetch_failed.add(contact_id)
                             logger.warning(f"   get_contact_by_id returned None for {contact_id} (404 or API error)")
-                    except Exception as e:
-                        self._lead_contact_ids_fetch_failed.add(contact_id)
-                        logger.warning(f"   Could not fetch contact {contact_id}: {e}")
-                    time.sleep(0.12)  # rate limit
                 logger.info(f"   Found {len(all_leads)} leads via fetch-by-ID ({len(self._lead_contact_ids_fetch_failed)} fetch failed)")
             
             # Step 2: Fetch leads by email via search API (so we find all 208 without depending on list order/limit)
@@ -756,6 +1257,7 @@ class EnhancedDatabaseSync:
                 logger.info(f"   Fetching {len(emails_still_needed)} lead contacts by email from GHL (POST /contacts/search)...")
                 loc_id = getattr(self.ghl_api, 'location_id', None) or os.getenv('GHL_LOCATION_ID') or (AppConfig.GHL_LOCATION_ID if hasattr(AppConfig, 'GHL_LOCATION_ID') else None)
                 for email in list(emails_still_needed):
+                    self._pace_ghl_request()
                     try:
                         contacts = self.ghl_api.search_contacts_by_email(email, location_id=loc_id)
                         if contacts:
@@ -766,36 +1268,37 @@ class EnhancedDatabaseSync:
                                 emails_still_needed.discard(email)
                     except Exception as e:
                         logger.debug(f"   Search by email failed for {email}: {e}")
-                    time.sleep(0.12)
                 logger.info(f"   Found {len(all_leads)} leads total after fetch-by-email")
             
             # Step 3: Batch-scan GHL contacts for any emails still not found (fallback)
             limit = 100
             offset = 0
-            matched_count = len(all_leads)
+            matched_by_email = 0
+            matched_by_opportunity = 0
             emails_still_needed = set(local_lead_emails.keys()) - {
                 c.get('email', '').lower() for c in all_leads.values() if c.get('email')
             }
-            if emails_still_needed:
-                logger.info(f"   Fetching GHL contacts in batches to match {len(emails_still_needed)} remaining by email...")
-            
-            while emails_still_needed:
+            # Local lead ids still unmatched; any match (email or opportunity) removes its lead
+            remaining = {local_lead_emails[email] for email in emails_still_needed}
+            opportunity_ids = frozenset(local_lead_opportunity_ids)
+            scanning = bool(remaining)
+            if scanning:
+                logger.info(f"   Fetching GHL contacts in batches to match {len(remaining)} remaining by email...")
+            log_debug = logger.isEnabledFor(logging.DEBUG)
+            
+            while remaining:
                 logger.debug(f"   Fetching GHL contacts batch (offset: {offset}, limit: {limit})")
                 
                 url = f"{self.ghl_api.v2_base_url}/contacts/"
-                headers = {
-                    "Authorization": f"Bearer {self.ghl_api.private_token}",
-                    "Version": "2021-07-28"
-                }
-                
                 params = {
                     'locationId': self.ghl_api.location_id,
                     'limit': limit,
                     'skip': offset
                 }
                 
-                import requests
-                response = requests.get(url, headers=headers, params=params)
+                # Pooled session: auth headers, keep-alive and retries are set up in __init__
+                self._pace_ghl_request()
+                response = self._http.get(url, params=params, timeout=(5, 30))
                 
                 if response.status_code != 200:
                     logger.error(f"❌ Failed to fetch GHL contacts: {response.status_code}")
@@ -821,31 +1324,32 @@ class EnhancedDatabaseSync:
                     
                     # Match by email (for leads without ghl_contact_id or not yet found)
                     if contact_email and contact_email in local_lead_emails:
-                        all_leads[contact_id] = contact
+                        all_leads[contact_id] = self._project_lead_contact(contact)
                         matched = True
                         match_type = "by email"
-                        emails_still_needed.discard(contact_email)
-                        logger.info(f"   Found lead by email, updating GHL contact ID: {contact_id}")
+                        remaining.discard(local_lead_emails[contact_email])
+                        matched_by_email += 1
                     
-                    # Match by opportunity ID in custom fields
-                    if not matched:
-                        custom_fields = contact.get('customFields', [])
-                        for field in custom_fields:
-                            field_value = field.get('value', '')
-                            if field_value in local_lead_opportunity_ids:
-                                all_leads[contact_id] = contact
-                                matched = True
-                                match_type = f"by opportunity ID: {field_value}"
-                                break
+                    # Match by opportunity ID in custom fields (one set intersection per contact)
+                    if not matched and opportunity_ids:
+                        hit = opportunity_ids.intersection(
+                            f.get('value') for f in contact.get('customFields', ())
+                            if isinstance(f.get('value'), str)
+                        )
+                        if hit:
+                            all_leads[contact_id] = self._project_lead_contact(contact)
+                            matched = True
+                            match_type = f"by opportunity ID: {next(iter(hit))}"
+                            remaining.difference_update(local_lead_opportunity_ids[opp_id] for opp_id in hit)
+                            matched_by_opportunity += 1
                     
-                    if matched:
-                        matched_count += 1
+                    if matched and log_debug:
                         contact_name = f"{contact.get('firstName', '')} {contact.get('lastName', '')}".strip()
                         logger.debug(f"   Matched lead {match_type}: {contact_name} ({contact_email})")
                 
-                # Early exit if we've matched all emails we needed from batch scan
-                if not emails_still_needed:
-                    logger.info("   Matched all leads by email - stopping batch scan")
+                # Early exit once every lead we were scanning for has matched
+                if not remaining:
+                    logger.info("   Matched all remaining leads - stopping batch scan")
                     break
                 
                 offset += limit
@@ -854,85 +1358,91 @@ class EnhancedDatabaseSync:
                 if offset > 15000:
                     logger.warning("   Reached 15,000 contact batch limit - stopping search")
                     break
-                
-                time.sleep(0.2)  # Rate limiting
+            
+            if scanning:
+                logger.info(f"   Batch scan matched {matched_by_email} by email, {matched_by_opportunity} by opportunity ID")
             
             # Calculate total expected leads (some may be matched by email/opportunity)
-            total_expected = len(set(list(lead_id_map.values()) + list(local_lead_emails.values())))
-            logger.info(f"✅ Fetched {len(all_leads)} lead contacts from GHL out of {total_expected} local leads")
+            all_local_ids = set(lead_id_map.values())
+            all_local_ids.update(local_lead_emails.values())
+            logger.info(f"✅ Fetched {len(all_leads)} lead contacts from GHL out of {len(all_local_ids)} local leads")
             
-            # Check which local leads weren't matched
+            # Check which local leads weren't matched - by GHL ID or by email, in one pass
             matched_local_ids = set()
-            for ghl_id in all_leads.keys():
+            for ghl_id, contact in all_leads.items():
                 if ghl_id in lead_id_map:
                     matched_local_ids.add(lead_id_map[ghl_id])
-            
-            # Also check for leads matched by email
-            for contact in all_leads.values():
-                email = contact.get('email', '').lower() if contact.get('email') else ''
-                if email in local_lead_emails:
-                    matched_local_ids.add(local_lead_emails[email])
+                email = contact.get('email')
+                if email:
+                    local_id = local_lead_emails.get(email.lower())
+                    if local_id is not None:
+                        matched_local_ids.add(local_id)
             
             # Find unmatched leads
-            all_local_ids = set(list(lead_id_map.values()) + list(local_lead_emails.values()))
             unmatched_local_ids = all_local_ids - matched_local_ids
             
             if unmatched_local_ids:
                 logger.warning(f"⚠️ {len(unmatched_local_ids)} local leads not found in GHL")
                 # Get details of first 5 unmatched leads for debugging
-                conn = simple_db_instance._get_raw_conn()
-                cursor = conn.cursor()
-                for lead_id in list(unmatched_local_ids)[:5]:
-                    cursor.execute("SELECT customer_email, ghl_contact_id FROM leads WHERE id = ?", (lead_id,))
-                    row = cursor.fetchone()
-                    if row:
-                        logger.info(f"   Not found: Email: {row[0]}, GHL ID: {row[1]}")
-                conn.close()
+                sample_ids = list(unmatched_local_ids)[:5]
+                cursor.execute(
+                    f"SELECT customer_email, ghl_contact_id FROM leads WHERE id IN ({', '.join('?' * len(sample_ids))})",
+                    sample_ids
+                )
+                for row in cursor.fetchall():
+                    logger.info(f"   Not found: Email: {row['customer_email']}, GHL ID: {row['ghl_contact_id']}")
             
             return all_leads
             
         except Exception as e:
             logger.error(f"❌ Error fetching GHL leads: {e}")
             return {}
+        finally:
+            if conn:
+                conn.close()
+    
+    @classmethod
+    def _project_lead_contact(cls, contact: Dict) -> Dict:
+        """
+        Copy of a scanned GHL contact with only what the lead sync reads,
+        so the rest of each page can be freed once the page is matched
+        """
+        projected = {key: contact[key] for key in ('id',) + cls._LEAD_CONTACT_HASH_KEYS if key in contact}
+        projected['customFields'] = [
+            cf for cf in contact.get('customFields', ())
+            if cf.get('id') in cls._LEAD_CUSTOM_FIELD_IDS
+        ]
+        return projected
     
-    def _get_local_leads(self) -> Dict[str, Dict]:
+    def _get_local_leads(self) -> Tuple[Dict[str, Dict], Dict[str, Dict], Dict[str, Dict]]:
         """
-        Get all local leads - returns both:
+        Get all local leads - returns three lookups over the same lead dicts:
         1. Dict keyed by GHL contact ID
-        2. Dict keyed by email (for leads without GHL ID)
+        2. Dict keyed by lowercased email (for leads without GHL ID)
+        3. Dict keyed by local lead id (every lead reachable from 1 or 2)
         """
         local_leads_by_ghl_id = {}
         local_leads_by_email = {}
         
         try:
-            conn = simple_db_instance._get_raw_conn()
+            # Same held connection the lead updates are flushed on; keyed rows are
+            # cursor-level so the held connection keeps its default tuple rows
+            conn = self._connection()
             cursor = conn.cursor()
+            cursor.arraysize = LEAD_ROW_FETCH_SIZE
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute("""
                 SELECT id, ghl_contact_id, customer_name, customer_email, 
                        customer_phone, primary_service_category, 
                        specific_service_requested, customer_zip_code,
-                       service_county, service_state, status, vendor_id,
+                       service_zip_code, service_county, service_state, status, vendor_id,
                        ghl_opportunity_id
                 FROM leads
             """)
             
-            for row in cursor.fetchall():
-                lead = {
-                    'id': row[0],
-                    'ghl_contact_id': row[1],
-                    'customer_name': row[2],
-                    'customer_email': row[3],
-                    'customer_phone': row[4],
-                    'primary_service_category': row[5],
-                    'specific_service_requested': row[6],
-                    'customer_zip_code': row[7],
-                    'service_county': row[8],
-                    'service_state': row[9],
-                    'status': row[10],
-                    'vendor_id': row[11],
-                    'ghl_opportunity_id': row[12] if len(row) > 12 else None
-                }
+            for row in cursor:
+                lead = dict(row)
                 
                 # Index by GHL contact ID if available
                 if lead['ghl_contact_id']:
@@ -943,23 +1453,20 @@ class EnhancedDatabaseSync:
                     email_lower = lead['customer_email'].lower()
                     local_leads_by_email[email_lower] = lead
             
-            conn.close()
-            
             logger.info(f"✅ Found {len(local_leads_by_ghl_id)} leads with GHL IDs")
             logger.info(f"   Found {len(local_leads_by_email)} leads with emails")
             
-            # Return combined dict - GHL ID takes precedence
-            combined = {}
-            combined.update(local_leads_by_email)  # Add email-indexed leads first
-            combined.update(local_leads_by_ghl_id)  # Override with GHL-ID indexed (more reliable)
+            local_leads_by_id = {lead['id']: lead for lead in local_leads_by_email.values()}
+            local_leads_by_id.update((lead['id'], lead) for lead in local_leads_by_ghl_id.values())
             
-            return combined
+            return local_leads_by_ghl_id, local_leads_by_email, local_leads_by_id
             
         except Exception as e:
             logger.error(f"❌ Error fetching local leads: {e}")
-            return {}
+            return {}, {}, {}
     
-    def _process_lead_sync(self, ghl_leads: Dict, local_leads: Dict):
+    def _process_lead_sync(self, ghl_leads: Dict, local_leads_by_ghl_id: Dict,
+                           local_leads_by_email: Dict, local_leads_by_id: Dict):
         """
         Process lead sync - ONLY updates existing leads
         
@@ -968,36 +1475,41 @@ class EnhancedDatabaseSync:
         This prevents duplicate leads from being created.
         """
         # Track which local lead IDs were processed (found in GHL and updated).
-        # local_leads is keyed by both ghl_contact_id and email, so we must use
-        # local lead id to decide "missing", not the dict key (email keys are never in processed_ghl_ids).
+        # A lead can be reachable by both ghl_contact_id and email, so "missing" is
+        # decided by local lead id, not by either lookup key.
         processed_local_lead_ids = set()
         
         # Process leads that exist in both GHL and local DB
         for ghl_id, ghl_contact in ghl_leads.items():
             # Match by GHL contact ID first, then by email (lead may be keyed only by email locally)
-            local_lead = local_leads.get(ghl_id)
+            local_lead = local_leads_by_ghl_id.get(ghl_id)
             if not local_lead and ghl_contact.get('email'):
                 email_lower = ghl_contact.get('email', '').lower()
-                local_lead = local_leads.get(email_lower)
+                local_lead = local_leads_by_email.get(email_lower)
             if local_lead:
                 self._update_local_lead(local_lead, ghl_contact)
                 processed_local_lead_ids.add(local_lead['id'])
             else:
                 logger.warning(f"⚠️ GHL contact {ghl_id} fetched but not found in local leads - skipping")
         
-        # Build set of unique local leads by id (local_leads has duplicate entries keyed by email and ghl_id)
         ids_fetch_failed = getattr(self, '_lead_contact_ids_fetch_failed', set())
-        all_local_lead_ids = set(lead['id'] for lead in local_leads.values())
         # Handle leads that exist locally but were never found in GHL
-        for local_lead_id in all_local_lead_ids:
+        for local_lead_id, local_lead in local_leads_by_id.items():
             if local_lead_id not in processed_local_lead_ids:
-                local_lead = next(lead for lead in local_leads.values() if lead['id'] == local_lead_id)
                 ghl_cid = local_lead.get('ghl_contact_id') or ''
                 # Do NOT mark as deleted when fetch-by-ID failed (404/API error) - avoid false positives
                 if ghl_cid and ghl_cid in ids_fetch_failed:
                     logger.warning(f"   Skipping mark-deleted for lead {local_lead.get('customer_name')} (ghl_contact_id {ghl_cid}): fetch by ID failed - leaving status unchanged")
                     continue
                 self._handle_missing_lead(local_lead)
+        
+        # Only leads seen in this pass keep their no-op hash, so the per-process cache
+        # can't grow without bound across runs
+        for lead_id in self._unchanged_lead_hashes.keys() - processed_local_lead_ids:
+            del self._unchanged_lead_hashes[lead_id]
+        
+        # Write all buffered lead updates in one transaction
+        self._flush_lead_updates()
     
     def _handle_missing_lead(self, local_lead: Dict):
         """
@@ -1011,12 +1523,10 @@ class EnhancedDatabaseSync:
             logger.warning(f"⚠️ Lead exists locally but not in GHL: {lead_name}")
             
             # Mark as inactive/deleted (safer than hard delete)
+            # leads_deleted is counted by _flush_lead_updates once the row is written
             updates = {'status': 'inactive_ghl_deleted'}
-            success = self._update_lead_record(lead_id, updates)
-            
-            if success:
-                self.stats['leads_deleted'] += 1
-                logger.info(f"🔴 Deactivated lead (deleted from GHL): {lead_name}")
+            if self._update_lead_record(lead_id, updates, stat='leads_deleted'):
+                logger.info(f"🔴 Deactivating lead (deleted from GHL): {lead_name}")
             
             # Option 2: Actually delete (more aggressive)
             # conn = self._get_conn()
@@ -1036,19 +1546,32 @@ class EnhancedDatabaseSync:
             updates = self._extract_lead_updates(local_lead, ghl_contact)
             
             if updates:
-                success = self._update_lead_record(local_lead['id'], updates)
-                if success:
-                    self.stats['leads_updated'] += 1
-                    logger.info(f"✅ Updated lead: {local_lead.get('customer_name')}")
+                # leads_updated is counted by _flush_lead_updates once the row is written
+                if self._update_lead_record(local_lead['id'], updates, stat='leads_updated'):
+                    logger.info(f"✅ Queued lead update: {local_lead.get('customer_name')}")
         except Exception as e:
             logger.error(f"❌ Error updating lead: {e}")
     
+    @staticmethod
+    def _lead_custom_fields(ghl_contact: Dict) -> Dict[str, Any]:
+        """custom field id -> value for a GHL contact, built once and kept on the contact as '_cf_map'"""
+        custom_fields = ghl_contact.get('_cf_map')
+        if custom_fields is None:
+            custom_fields = {cf['id']: cf.get('value', '') 
+                            for cf in ghl_contact.get('customFields', [])}
+            ghl_contact['_cf_map'] = custom_fields
+        return custom_fields
+    
     def _extract_lead_updates(self, lead: Dict, ghl_contact: Dict) -> Dict[str, Any]:
         """Extract lead fields that need updating"""
         updates = {}
         
-        custom_fields = {cf['id']: cf.get('value', '') 
-                        for cf in ghl_contact.get('customFields', [])}
+        custom_fields = self._lead_custom_fields(ghl_contact)
+        
+        # Same lead + contact inputs as a previous no-change diff -> still no changes
+        input_hash = self._lead_input_hash(lead, ghl_contact, custom_fields)
+        if self._unchanged_lead_hashes.get(lead.get('id')) == input_hash:
+            return updates
         
         for db_field, ghl_field in self.LEAD_GHL_FIELDS.items():
             current_value = lead.get(db_field)
@@ -1082,8 +1605,7 @@ class EnhancedDatabaseSync:
             zip_code = str(ghl_contact.get('postalCode'))
         # Check address field for embedded ZIP (last 5 digits)
         elif ghl_contact.get('address1'):
-            import re
-            zip_match = re.search(r'\b(\d{5})\b', ghl_contact.get('address1', ''))
+            zip_match = _ZIP_RE.search(ghl_contact.get('address1') or '')
             if zip_match:
                 zip_code = zip_match.group(1)
         
@@ -1094,8 +1616,7 @@ class EnhancedDatabaseSync:
         # Handle ZIP to county/state conversion
         zip_to_convert = updates.get('service_zip_code') or lead.get('service_zip_code')
         if zip_to_convert and len(str(zip_to_convert)) == 5:
-            from api.services.location_service import location_service
-            location_data = location_service.zip_to_location(str(zip_to_convert))
+            location_data = _cached_zip_lookup(str(zip_to_convert))
             if not location_data.get('error'):
                 county = location_data.get('county', '')
                 state = location_data.get('state', '')
@@ -1104,13 +1625,25 @@ class EnhancedDatabaseSync:
                 if state and not lead.get('service_state'):
                     updates['service_state'] = state
         
+        if updates:
+            self._unchanged_lead_hashes.pop(lead.get('id'), None)
+        else:
+            self._unchanged_lead_hashes[lead.get('id')] = input_hash
+        
         return updates
     
+    def _lead_input_hash(self, lead: Dict, ghl_contact: Dict, custom_fields: Dict) -> int:
+        """Hash of every lead and GHL contact value _extract_lead_updates looks at"""
+        return hash((
+            tuple(lead.get(field) for field in self._LEAD_HASH_FIELDS),
+            tuple(ghl_contact.get(key) for key in self._LEAD_CONTACT_HASH_KEYS),
+            tuple(repr(custom_fields.get(field_id)) for field_id in self._LEAD_CUSTOM_FIELD_IDS),
+        ))
+    
     def _create_local_lead(self, ghl_contact: Dict):
         """Create new lead in local DB from GHL contact"""
         try:
-            custom_fields = {cf['id']: cf.get('value', '') 
-                           for cf in ghl_contact.get('customFields', [])}
+            custom_fields = self._lead_custom_fields(ghl_contact)
             
             account = simple_db_instance.get_account_by_ghl_location_id(
                 os.getenv('GHL_LOCATION_ID') or AppConfig.GHL_LOCATION_ID
@@ -1135,14 +1668,13 @@ class EnhancedDatabaseSync:
             
             # Get county/state from ZIP
             if lead_data['customer_zip_code']:
-                from api.services.location_service import location_service
-                location_data = location_service.zip_to_location(lead_data['customer_zip_code'])
+                location_data = _cached_zip_lookup(lead_data['customer_zip_code'])
                 if not location_data.get('error'):
                     lead_data['service_county'] = location_data.get('county', '')
                     lead_data['service_state'] = location_data.get('state', '')
             
             # Insert into database
-            conn = simple_db_instance._get_raw_conn()
+            conn = self._connection()
             cursor = conn.cursor()
             
             columns = list(lead_data.keys())
@@ -1156,7 +1688,6 @@ class EnhancedDatabaseSync:
             
             cursor.execute(query, values)
             conn.commit()
-            conn.close()
             
             self.stats['leads_created'] += 1
             logger.info(f"✅ Created NEW lead from GHL: {lead_data['customer_name']}")
@@ -1164,40 +1695,26 @@ class EnhancedDatabaseSync:
         except Exception as e:
             logger.error(f"❌ Error creating lead from GHL: {e}")
     
-    def _update_lead_record(self, lead_id: str, updates: Dict) -> bool:
-        """Update lead in database"""
-        try:
-            if not updates:
-                return True
-            
-            conn = simple_db_instance._get_raw_conn()
-            cursor = conn.cursor()
-            
-            set_clauses = []
-            values = []
-            
-            for field, value in updates.items():
-                set_clauses.append(f"{field} = ?")
-                values.append(value)
-            
-            set_clauses.append("updated_at = CURRENT_TIMESTAMP")
-            values.append(lead_id)
-            
-            query = f"""
-                UPDATE leads 
-                SET {', '.join(set_clauses)}
-                WHERE id = ?
-            """
-            
-            cursor.execute(query, values)
-            conn.commit()
-            conn.close()
-            
+    def _update_lead_record(self, lead_id: str, updates: Dict, stat: Optional[str] = None) -> bool:
+        """Queue a lead update; written by _flush_lead_updates, which bumps self.stats[stat] on success"""
+        if not updates:
             return True
-            
-        except Exception as e:
-            logger.error(f"❌ Error updating lead {lead_id}: {e}")
-            return False
+        
+        # Group by column set so each group shares one UPDATE statement
+        columns = tuple(sorted(updates))
+        self._pending_lead_updates[columns].append(
+            tuple(updates[field] for field in columns) + (lead_id,)
+        )
+        if stat:
+            self._pending_lead_stats[lead_id] = stat
+        return True
+    
+    def _flush_lead_updates(self) -> bool:
+        """Write all queued lead updates with one executemany per column set (row by row on failure)"""
+        pending, stat_keys = self._pending_lead_updates, self._pending_lead_stats
+        self._pending_lead_updates = defaultdict(list)
+        self._pending_lead_stats = {}
+        return self._write_grouped_updates('leads', pending, stat_keys)
 
 
 # Main function for testing
@@ -36,7 +36,7 @@ EFFICIENCY PLAN (vs V2):
 
 5. REUSE V2 SYNC LOGIC
    - _process_vendor_sync(vendor_contacts, local_vendors_tuple)
-   - _process_lead_sync(lead_contacts, local_leads) with same missing-lead
+   - _process_lead_sync(lead_contacts, local_leads_tuple) with same missing-lead
      handling (ids_fetch_failed so we don't mark as deleted when fetch failed).
 
 Result: Fewer API calls (deduplicated IDs, one list pass for both), less
@@ -47,9 +47,12 @@ import json
 import logging
 import sys
 import os
+import re
+import sqlite3
 from typing import Dict, List, Any, Optional, Set, Tuple
-from datetime import datetime
 import time
+import threading
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add project root to path
@@ -69,6 +72,15 @@ from utils.ghl_contact_classifier import (
     INACTIVE_GHL_DELETED_STATUS,
 )
 
+# orjson is an optional, faster drop-in for serializing the JSON list fields
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    from json import dumps as _json_dumps
+
 logger = logging.getLogger(__name__)
 
 # Rate limit between GHL API calls (seconds)
@@ -78,6 +90,58 @@ FETCH_BY_ID_WORKERS = 3
 # Pagination for POST /contacts/search (non-deprecated); max 500 per request
 SEARCH_PAGE_LIMIT = 500
 LIST_SCAN_CAP = 15000  # max contacts to scan in fallback
+# Values per filtered POST /contacts/search (search_contacts_by_values sends at most 100)
+SEARCH_VALUES_BATCH_SIZE = 100
+# Circuit breaker: abort before any write when more than this share of contact IDs hit a
+# GHL/transport error (GHL degraded), so live records are not flagged as deleted in GHL.
+# Not-found responses and contacts already flagged deleted don't count.
+FETCH_FAILURE_ABORT_RATIO = 0.2
+FETCH_FAILURE_MIN_ATTEMPTS = 20
+# Bound parameters per statement when batching writes (SQLite's classic variable limit)
+SQLITE_MAX_VARIABLES = 999
+# Per-connection SQLite settings for the sync connection, restored in close()
+SQLITE_SYNC_PRAGMAS = (('synchronous', 'NORMAL'), ('temp_store', 'MEMORY'))
+# First standalone 5-digit number in an address line (ZIP fallback when postalCode is empty)
+_ZIP_RE = re.compile(r'\b(\d{5})\b')
+
+
+class _TokenBucket:
+    """
+    Thread-safe request pacer: on average one acquire() per interval, with bursts of
+    up to `capacity`. The slot is reserved under the lock and the wait happens outside
+    it, so paced threads sleep concurrently instead of queueing behind each other.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self._interval = 1.0 / rate
+        self._burst = (max(1, capacity) - 1) * self._interval
+        self._next_time = 0.0  # theoretical time of the next request at the steady rate
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_time, now)
+            self._next_time = slot + self._interval
+            wait = slot - self._burst - now
+        if wait > 0:
+            time.sleep(wait)
+
+# Vendor columns holding a JSON list; compared as sets rather than as text
+JSON_LIST_FIELDS = frozenset({'service_categories', 'services_offered', 'coverage_states', 'coverage_counties'})
+
+
+def _is_fetch_error(status: Optional[int]) -> bool:
+    """True when a failed GET by ID was a GHL/transport error (no response, 429, 5xx), not "not found"."""
+    return status is None or status == 429 or status >= 500
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _normalize_for_compare(field_name: str, value: Any):
+    """Comparable form of a field value (memoized: many vendors share the same values)."""
+    if field_name in JSON_LIST_FIELDS:
+        return frozenset(json.loads(value) if value else [])
+    return str(value or '').strip()
 
 
 class EnhancedDatabaseSyncV3:
@@ -109,6 +173,12 @@ class EnhancedDatabaseSyncV3:
         'specific_service_requested': 'FT85QGi0tBq1AfVGNJ9v',
     }
 
+    # Local lead columns _extract_lead_updates compares against
+    _LEAD_DIFF_FIELDS = tuple(LEAD_GHL_FIELDS) + ('service_zip_code', 'service_county', 'service_state', 'status')
+
+    # lead id -> (contact dateUpdated, lead values) of its last diff that produced no updates (per process)
+    _unchanged_leads: Dict[str, Tuple[Any, Tuple]] = {}
+
     def __init__(self):
         try:
             from dotenv import load_dotenv
@@ -133,6 +203,18 @@ class EnhancedDatabaseSyncV3:
                 'errors': []
             }
             self._lead_contact_ids_fetch_failed: Set[str] = set()
+            self._fetch_attempts = 0  # unique contact IDs requested in the fetch phase
+            self._fetch_failures = 0  # of those, IDs a direct GET failed for with a GHL/transport error
+            # {row_id: updates} buffered while a sync pass runs; None = write straight through
+            self._pending_vendor_updates: Optional[Dict[str, Dict]] = None
+            self._pending_lead_updates: Optional[Dict[str, Dict]] = None
+            self._pending_new_leads: Optional[List[Dict]] = None  # lead rows queued for INSERT
+            self._zip_cache: Dict[str, Dict] = {}  # zip -> location_service result
+            self._conn = None  # held DB connection, see _connection()/close()
+            self._restore_pragmas: List[Tuple[str, Any]] = []
+            self._account: Optional[Dict] = None  # see _location_account()
+            # Shared by every GHL call in the fetch phase (by ID, email search, list fallback)
+            self._ghl_pacer = _TokenBucket(rate=1 / GHL_RATE_LIMIT_DELAY, capacity=FETCH_BY_ID_WORKERS)
             logger.info("✅ EnhancedDatabaseSyncV3 initialized (unified contact fetch)")
         except Exception as e:
             logger.error(f"❌ Failed to initialize sync v3: {e}")
@@ -142,7 +224,7 @@ class EnhancedDatabaseSyncV3:
         """Run full bi-directional sync using unified contact fetch."""
         logger.info("🔄 Starting V3 Database Sync (unified fetch)")
         logger.info("=" * 60)
-        start_time = datetime.now()
+        start_time = time.monotonic()
         try:
             # Step 1: Collect all identifiers (vendors + leads) and local data
             logger.info("\n📊 STEP 1: Collecting vendor and lead identifiers")
@@ -151,34 +233,74 @@ class EnhancedDatabaseSyncV3:
                 logger.warning("   No vendor or lead identifiers found")
                 return self._finish_sync(start_time, success=True)
 
-            # Step 2: Single unified contact fetch from GHL
-            logger.info("\n📊 STEP 2: Unified GHL contact fetch (by ID + email search + optional list)")
-            contact_map = self._unified_fetch_contacts(identifiers)
-            self.stats['ghl_contacts_fetched'] = len(contact_map)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Local vendor/lead rows (steps 4-5) only need SQLite - read them while GHL is fetched
+                local_vendors_future = executor.submit(self._get_local_vendors)
+                local_leads_future = executor.submit(self._get_local_leads)
+
+                # Step 2: Single unified contact fetch from GHL
+                logger.info("\n📊 STEP 2: Unified GHL contact fetch (by ID + email search + optional list)")
+                contact_map = self._unified_fetch_contacts(identifiers)
+                self.stats['ghl_contacts_fetched'] = len(contact_map)
+
+                local_vendors = local_vendors_future.result()
+                local_leads = local_leads_future.result()
+
+            attempts, failures = self._fetch_attempts, self._fetch_failures
+            if attempts > FETCH_FAILURE_MIN_ATTEMPTS and failures / attempts > FETCH_FAILURE_ABORT_RATIO:
+                error = (f"GHL fetch degraded: {failures}/{attempts} contacts could not be fetched; "
+                         "sync aborted before updating or flagging any records")
+                logger.error(f"❌ {error}")
+                self.stats['errors'].append(error)
+                return self._finish_sync(start_time, success=False, error=error)
 
             # Step 3: Classify into vendor vs lead contacts
             logger.info("\n📊 STEP 3: Classifying contacts (vendors vs leads)")
-            vendor_contacts = self._classify_vendor_contacts(contact_map, identifiers)
-            lead_contacts = self._classify_lead_contacts(contact_map, identifiers)
+            vendor_contacts, lead_contacts = self._classify_contacts(contact_map, identifiers)
             logger.info(f"   Vendor contacts: {len(vendor_contacts)}, Lead contacts: {len(lead_contacts)}")
 
             # Step 4: Process vendor sync
             logger.info("\n📊 STEP 4: Processing vendor sync")
-            local_vendors = self._get_local_vendors()
             self._process_vendor_sync(vendor_contacts, local_vendors)
 
             # Step 5: Process lead sync
             logger.info("\n📊 STEP 5: Processing lead sync")
-            local_leads = self._get_local_leads()
             self._process_lead_sync(lead_contacts, local_leads)
 
             return self._finish_sync(start_time, success=True)
         except Exception as e:
             logger.error(f"❌ Sync failed: {e}")
             return self._finish_sync(start_time, success=False, error=str(e))
+        finally:
+            self.close()
+
+    def _connection(self):
+        """Return the held database connection, opening it on first use (WAL + SQLITE_SYNC_PRAGMAS on SQLite)"""
+        if self._conn is None:
+            conn = simple_db_instance._get_raw_conn()
+            if simple_db_instance.engine.dialect.name == 'sqlite':
+                cursor = conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                for name, value in SQLITE_SYNC_PRAGMAS:
+                    cursor.execute(f"PRAGMA {name}")
+                    self._restore_pragmas.append((name, cursor.fetchone()[0]))
+                    cursor.execute(f"PRAGMA {name}={value}")
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Release the held database connection, restoring its per-connection pragmas first"""
+        if self._conn is not None:
+            if self._restore_pragmas:
+                cursor = self._conn.cursor()
+                for name, value in self._restore_pragmas:
+                    cursor.execute(f"PRAGMA {name}={value}")
+                self._restore_pragmas = []
+            self._conn.close()
+            self._conn = None
 
-    def _finish_sync(self, start_time: datetime, success: bool, error: Optional[str] = None) -> Dict[str, Any]:
-        duration = (datetime.now() - start_time).total_seconds()
+    def _finish_sync(self, start_time: float, success: bool, error: Optional[str] = None) -> Dict[str, Any]:
+        duration = time.monotonic() - start_time
         logger.info("\n" + "=" * 60)
         logger.info("🎉 V3 SYNC COMPLETED" if success else "❌ V3 SYNC FAILED")
         logger.info(f"⏱️  Duration: {duration:.2f}s")
@@ -210,40 +332,48 @@ class EnhancedDatabaseSyncV3:
         lead_emails, lead_opportunity_ids, lead_id_by_contact_id, lead_id_by_email.
         """
         try:
-            conn = simple_db_instance._get_raw_conn()
-            cursor = conn.cursor()
+            cursor = self._connection().cursor()
 
             vendor_contact_ids: Set[str] = set()
             vendor_emails: Set[str] = set()
+            # Emails are trimmed/lowercased by SQLite; blank ones come back as ''
+            # Contact IDs whose rows are already flagged deleted in GHL vs. any other status;
+            # IDs only in the first set are expected to 404 and stay out of the circuit breaker
+            deleted_ids: Set[str] = set()
+            live_ids: Set[str] = set()
             cursor.execute("""
-                SELECT ghl_contact_id, email FROM vendors
-                WHERE ghl_contact_id IS NOT NULL OR email IS NOT NULL
+                SELECT ghl_contact_id, LOWER(TRIM(email)), status FROM vendors
+                WHERE ghl_contact_id IS NOT NULL OR (email IS NOT NULL AND email != '')
             """)
-            for row in cursor.fetchall():
+            # Iterate the cursor (no fetchall() list) with the set adders bound once
+            add_vendor_id, add_vendor_email = vendor_contact_ids.add, vendor_emails.add
+            for row in cursor:
                 if row[0]:
-                    vendor_contact_ids.add(row[0])
+                    add_vendor_id(row[0])
+                    (deleted_ids if row[2] == INACTIVE_GHL_DELETED_STATUS else live_ids).add(row[0])
                 if row[1]:
-                    vendor_emails.add((row[1] or "").strip().lower())
+                    add_vendor_email(row[1])
 
             lead_contact_ids: Set[str] = set()
             lead_emails: Dict[str, Any] = {}   # email -> local lead id (for logging)
             lead_opportunity_ids: Dict[str, str] = {}  # opp_id -> local lead id
             lead_id_by_contact_id: Dict[str, str] = {}
             cursor.execute("""
-                SELECT DISTINCT ghl_contact_id, customer_email, ghl_opportunity_id, id
+                SELECT DISTINCT ghl_contact_id, LOWER(TRIM(customer_email)), ghl_opportunity_id, id, status
                 FROM leads
                 WHERE (ghl_contact_id IS NOT NULL AND ghl_contact_id != '')
                    OR (customer_email IS NOT NULL AND customer_email != '')
             """)
-            for row in cursor.fetchall():
+            add_lead_id = lead_contact_ids.add
+            for row in cursor:
                 if row[0]:
-                    lead_contact_ids.add(row[0])
+                    add_lead_id(row[0])
                     lead_id_by_contact_id[row[0]] = row[3]
+                    (deleted_ids if row[4] == INACTIVE_GHL_DELETED_STATUS else live_ids).add(row[0])
                 if row[1]:
-                    lead_emails[(row[1] or "").strip().lower()] = row[3]
+                    lead_emails[row[1]] = row[3]
                 if row[2]:
                     lead_opportunity_ids[row[2]] = row[3]
-            conn.close()
 
             all_contact_ids = vendor_contact_ids | lead_contact_ids
             logger.info(f"   Vendor IDs: {len(vendor_contact_ids)}, emails: {len(vendor_emails)}")
@@ -258,6 +388,7 @@ class EnhancedDatabaseSyncV3:
                 'lead_opportunity_ids': lead_opportunity_ids,
                 'lead_id_by_contact_id': lead_id_by_contact_id,
                 'all_contact_ids': all_contact_ids,
+                'known_deleted_contact_ids': deleted_ids - live_ids,
             }
         except Exception as e:
             logger.error(f"❌ Error collecting identifiers: {e}")
@@ -271,11 +402,24 @@ class EnhancedDatabaseSyncV3:
     def _unified_fetch_contacts(self, identifiers: Dict[str, Any]) -> Dict[str, Dict]:
         """
         Fetch all needed contacts in one flow:
-        1) Fetch by ID for each unique contact ID (concurrent with rate limit).
-        2) For missing emails, search by email (one call per missing email).
+        1) Batched id-filter searches for all unique contact IDs; IDs the search did not
+           return are fetched one by one (concurrent with rate limit).
+        2) For missing emails, batched email-filter searches (SEARCH_VALUES_BATCH_SIZE per call).
         3) Optional: one paginated list pass to match remaining by email/opportunity (cap LIST_SCAN_CAP).
         """
         contact_map: Dict[str, Dict] = {}
+        contact_by_email: Dict[str, Dict] = {}  # inverse index, kept in step with contact_map
+
+        def add_contact(cid: str, c: Dict):
+            # Normalize once; the classifiers and both sync passes read these instead
+            c['_email_lower'] = (c.get('email') or '').strip().lower()
+            c['_tags_lower'] = get_contact_tags_list(c)
+            self._custom_fields(c)
+            self._contact_name(c)
+            contact_map[cid] = c
+            if c['_email_lower']:
+                contact_by_email[c['_email_lower']] = c
+
         loc_id = getattr(self.ghl_api, 'location_id', None) or os.getenv('GHL_LOCATION_ID') or (
             AppConfig.GHL_LOCATION_ID if hasattr(AppConfig, 'GHL_LOCATION_ID') else None)
         all_ids = list(identifiers.get('all_contact_ids') or [])
@@ -286,63 +430,95 @@ class EnhancedDatabaseSyncV3:
 
         # 1) Fetch by ID (each unique ID once); track which lead IDs failed
         self._lead_contact_ids_fetch_failed = set()
+        # Contacts already flagged deleted are re-checked (they may be restored in GHL) but
+        # don't count toward the circuit breaker
+        known_deleted = identifiers.get('known_deleted_contact_ids') or set()
+        self._fetch_attempts = len(all_ids) - len(known_deleted.intersection(all_ids))
+        self._fetch_failures = 0
         if all_ids:
-            logger.info(f"   Fetching {len(all_ids)} contacts by ID (workers={FETCH_BY_ID_WORKERS})...")
-            last_request_time = [0.0]  # mutable for closure
-            import threading
-            lock = threading.Lock()
-
-            def fetch_one(cid: str) -> Tuple[str, Optional[Dict]]:
-                with lock:
-                    now = time.monotonic()
-                    wait = GHL_RATE_LIMIT_DELAY - (now - last_request_time[0])
-                    if wait > 0:
-                        time.sleep(wait)
-                    last_request_time[0] = time.monotonic()
+            logger.info(f"   Searching {len(all_ids)} contacts by ID ({SEARCH_VALUES_BATCH_SIZE} per request)...")
+            wanted_ids = set(all_ids)
+
+            def search_batch(batch: List[str]) -> List[Dict]:
+                self._ghl_pacer.acquire()
                 try:
-                    c = self.ghl_api.get_contact_by_id(cid, location_id=loc_id)
-                    return (cid, c)
+                    return self.ghl_api.search_contacts_by_values('id', batch, location_id=loc_id)
+                except Exception as e:
+                    logger.debug(f"   ID batch search failed: {e}")
+                    return []
+
+            # Batches run FETCH_BY_ID_WORKERS at a time; results are merged on this thread
+            batches = [all_ids[start:start + SEARCH_VALUES_BATCH_SIZE]
+                       for start in range(0, len(all_ids), SEARCH_VALUES_BATCH_SIZE)]
+            with ThreadPoolExecutor(max_workers=FETCH_BY_ID_WORKERS) as executor:
+                for contacts in executor.map(search_batch, batches):
+                    for c in contacts:
+                        if c.get('id') in wanted_ids:
+                            add_contact(c['id'], c)
+            # Anything the search missed (or a failed batch) still gets a direct fetch, so a
+            # search error never makes a contact look deleted
+            ids_not_in_search = [cid for cid in all_ids if cid not in contact_map]
+            logger.info(f"   Fetching {len(ids_not_in_search)} contacts by ID (workers={FETCH_BY_ID_WORKERS})...")
+
+            def fetch_one(cid: str) -> Tuple[str, Optional[Dict], Optional[int]]:
+                self._ghl_pacer.acquire()
+                try:
+                    c, status = self.ghl_api.get_contact_by_id_with_status(cid, location_id=loc_id)
+                    return (cid, c, status)
                 except Exception as e:
                     logger.debug(f"   Fetch failed for {cid}: {e}")
-                    return (cid, None)
+                    return (cid, None, None)
 
             with ThreadPoolExecutor(max_workers=FETCH_BY_ID_WORKERS) as executor:
-                futures = {executor.submit(fetch_one, cid): cid for cid in all_ids}
+                futures = {executor.submit(fetch_one, cid): cid for cid in ids_not_in_search}
                 for fut in as_completed(futures):
-                    cid, contact = fut.result()
+                    cid, contact, status = fut.result()
                     if contact:
-                        contact_map[cid] = contact
+                        add_contact(cid, contact)
                     else:
+                        # Only GHL/transport errors trip the breaker; a 404 is a contact deleted in GHL
+                        if _is_fetch_error(status) and cid not in known_deleted:
+                            self._fetch_failures += 1
                         if cid in lead_contact_ids:
                             self._lead_contact_ids_fetch_failed.add(cid)
                             logger.warning(f"   get_contact_by_id returned None for lead contact {cid}")
             logger.info(f"   Fetched {len(contact_map)} contacts by ID ({len(self._lead_contact_ids_fetch_failed)} lead IDs failed)")
 
         # 2) Missing emails: we need vendor_emails and lead_emails not yet in contact_map
-        emails_in_map = { (c.get('email') or '').strip().lower() for c in contact_map.values() if c.get('email') }
-        missing_emails = (vendor_emails | set(lead_emails.keys())) - emails_in_map
+        missing_emails = (vendor_emails | lead_emails.keys()) - contact_by_email.keys()
         if missing_emails:
             logger.info(f"   Searching by email for {len(missing_emails)} missing...")
-            for email in list(missing_emails):
+            emails = sorted(missing_emails)
+            for start in range(0, len(emails), SEARCH_VALUES_BATCH_SIZE):
+                batch = emails[start:start + SEARCH_VALUES_BATCH_SIZE]
+                self._ghl_pacer.acquire()
                 try:
-                    contacts = self.ghl_api.search_contacts_by_email(email, location_id=loc_id)
-                    if contacts:
-                        c = contacts[0]
-                        cid = c.get('id')
-                        if cid:
-                            contact_map[cid] = c
-                            missing_emails.discard(email)
+                    contacts = self.ghl_api.search_contacts_by_values('email', batch, location_id=loc_id)
                 except Exception as e:
-                    logger.debug(f"   Search by email failed for {email}: {e}")
-                time.sleep(GHL_RATE_LIMIT_DELAY)
+                    logger.debug(f"   Email batch search failed: {e}")
+                    continue
+                for c in contacts:
+                    email = (c.get('email') or '').strip().lower()
+                    cid = c.get('id')
+                    # First contact per email wins, as with the old one-search-per-email loop
+                    if cid and email in missing_emails:
+                        add_contact(cid, c)
+                        missing_emails.discard(email)
             logger.info(f"   After email search: {len(contact_map)} contacts, {len(missing_emails)} emails still missing")
 
-        # 3) Optional: one pass using POST /contacts/search (non-deprecated) for remaining missing emails / opportunity match
-        if missing_emails or lead_opp_ids:
+        # 3) Optional: one pass using POST /contacts/search (non-deprecated) for remaining missing emails / opportunity match.
+        # Opportunity IDs only matter for leads not already found by contact ID or email; GHL can't
+        # filter on "any custom field equals", so those are the only ones worth scanning for.
+        lead_id_by_contact_id = identifiers.get('lead_id_by_contact_id') or {}
+        found_lead_ids = {lead_id_by_contact_id[cid] for cid in contact_map if cid in lead_id_by_contact_id}
+        found_lead_ids.update(lead_emails[e] for e in contact_by_email if e in lead_emails)
+        remaining_opp_ids = {opp: lid for opp, lid in lead_opp_ids.items() if lid not in found_lead_ids}
+        if missing_emails or remaining_opp_ids:
             search_after = None
             total_scanned = 0
             logger.info(f"   Using POST /contacts/search (limit={SEARCH_PAGE_LIMIT}) for list fallback...")
             while total_scanned < LIST_SCAN_CAP:
+                self._ghl_pacer.acquire()
                 result = self.ghl_api.search_contacts_paginated(
                     location_id=loc_id,
                     limit=SEARCH_PAGE_LIMIT,
@@ -358,49 +534,47 @@ class EnhancedDatabaseSyncV3:
                         continue
                     email_lower = (contact.get("email") or "").strip().lower()
                     if email_lower and email_lower in missing_emails:
-                        c_copy = {k: v for k, v in contact.items() if k != "searchAfter"}
-                        contact_map[cid] = c_copy
+                        add_contact(cid, {k: v for k, v in contact.items() if k != "searchAfter"})
                         missing_emails.discard(email_lower)
-                    if cid not in contact_map and lead_opp_ids:
+                    if cid not in contact_map and remaining_opp_ids:
                         for f in contact.get("customFields", []):
-                            if (f.get("value") or "") in lead_opp_ids:
-                                c_copy = {k: v for k, v in contact.items() if k != "searchAfter"}
-                                contact_map[cid] = c_copy
+                            if (f.get("value") or "") in remaining_opp_ids:
+                                add_contact(cid, {k: v for k, v in contact.items() if k != "searchAfter"})
+                                del remaining_opp_ids[f.get("value")]
                                 break
                 total_scanned += len(contacts)
                 search_after = result.get("search_after")
-                if not search_after or (not missing_emails and not lead_opp_ids):
+                if not search_after or (not missing_emails and not remaining_opp_ids):
                     break
-                time.sleep(0.2)
             logger.info(f"   After POST /contacts/search fallback: {len(contact_map)} contacts (scanned {total_scanned})")
 
         return contact_map
 
-    def _classify_vendor_contacts(self, contact_map: Dict[str, Dict], identifiers: Dict[str, Any]) -> Dict[str, Dict]:
+    def _classify_contacts(self, contact_map: Dict[str, Dict],
+                           identifiers: Dict[str, Any]) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """
+        Split contact_map into (vendor_contacts, lead_contacts) in one pass. Staff are skipped.
+        Vendor = DB match or GHL signals; lead = DB match only and not vendor by GHL signals
+        (vendor takes precedence).
+        """
         vendor_ids = identifiers.get("vendor_contact_ids") or set()
         vendor_emails = identifiers.get("vendor_emails") or set()
-        return {
-            cid: c
-            for cid, c in contact_map.items()
-            if not is_staff_contact(c)
-            and (
-                cid in vendor_ids
-                or ((c.get("email") or "").strip().lower() in vendor_emails)
-                or is_vendor_by_ghl_signals(c)
-            )
-        }
-
-    def _classify_lead_contacts(self, contact_map: Dict[str, Dict], identifiers: Dict[str, Any]) -> Dict[str, Dict]:
-        """Lead = DB match only; exclude contacts that are vendor by GHL signals (vendor takes precedence)."""
         lead_ids = identifiers.get("lead_contact_ids") or set()
         lead_emails = identifiers.get("lead_emails") or {}
-        return {
-            cid: c
-            for cid, c in contact_map.items()
-            if not is_staff_contact(c)
-            and (cid in lead_ids or ((c.get("email") or "").strip().lower() in lead_emails))
-            and not is_vendor_by_ghl_signals(c)
-        }
+        vendor_contacts: Dict[str, Dict] = {}
+        lead_contacts: Dict[str, Dict] = {}
+        for cid, c in contact_map.items():
+            if is_staff_contact(c):
+                continue
+            email = c["_email_lower"]
+            if is_vendor_by_ghl_signals(c):
+                vendor_contacts[cid] = c
+                continue
+            if cid in vendor_ids or email in vendor_emails:
+                vendor_contacts[cid] = c
+            if cid in lead_ids or email in lead_emails:
+                lead_contacts[cid] = c
+        return vendor_contacts, lead_contacts
 
     # -------------------------------------------------------------------------
     # Local data (same as v2)
@@ -423,47 +597,50 @@ class EnhancedDatabaseSyncV3:
             self.stats['errors'].append(f"Local vendors: {str(e)}")
             return {}, {}
 
-    def _get_local_leads(self) -> Dict[str, Dict]:
+    def _get_local_leads(self) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
         local_by_ghl_id: Dict[str, Dict] = {}
         local_by_email: Dict[str, Dict] = {}
         try:
+            # Own connection, not _connection(): this runs on a worker thread during the GHL fetch
             conn = simple_db_instance._get_raw_conn()
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("""
                 SELECT id, ghl_contact_id, customer_name, customer_email, customer_phone,
                        primary_service_category, specific_service_requested, customer_zip_code,
-                       service_county, service_state, status, vendor_id, ghl_opportunity_id
+                       service_zip_code, service_county, service_state, status, vendor_id,
+                       ghl_opportunity_id
                 FROM leads
             """)
-            for row in cursor.fetchall():
-                lead = {
-                    'id': row[0], 'ghl_contact_id': row[1], 'customer_name': row[2], 'customer_email': row[3],
-                    'customer_phone': row[4], 'primary_service_category': row[5], 'specific_service_requested': row[6],
-                    'customer_zip_code': row[7], 'service_county': row[8], 'service_state': row[9],
-                    'status': row[10], 'vendor_id': row[11], 'ghl_opportunity_id': row[12] if len(row) > 12 else None
-                }
+            for row in cursor:
+                lead = dict(row)
                 if lead['ghl_contact_id']:
                     local_by_ghl_id[lead['ghl_contact_id']] = lead
                 if lead['customer_email']:
                     local_by_email[(lead['customer_email'] or '').strip().lower()] = lead
             conn.close()
-            combined = {}
-            combined.update(local_by_email)
-            combined.update(local_by_ghl_id)
-            return combined
+            return local_by_ghl_id, local_by_email
         except Exception as e:
             logger.error(f"❌ Error fetching local leads: {e}")
-            return {}
+            return {}, {}
 
     # -------------------------------------------------------------------------
     # Vendor sync (same logic as v2)
     # -------------------------------------------------------------------------
 
     def _process_vendor_sync(self, ghl_vendors: Dict[str, Dict], local_vendors_tuple: Tuple[Dict, Dict]):
+        self._pending_vendor_updates = {}
+        try:
+            self._sync_vendors(ghl_vendors, local_vendors_tuple)
+        finally:
+            pending, self._pending_vendor_updates = self._pending_vendor_updates, None
+            self._flush_updates('vendors', pending, self._update_vendor_record)
+
+    def _sync_vendors(self, ghl_vendors: Dict[str, Dict], local_vendors_tuple: Tuple[Dict, Dict]):
         local_by_ghl_id, local_by_email = local_vendors_tuple
         processed = set()
         for ghl_id, ghl_contact in ghl_vendors.items():
-            contact_email = (ghl_contact.get('email') or '').strip().lower()
+            contact_email = ghl_contact['_email_lower']
             matched = local_by_ghl_id.get(ghl_id) or (local_by_email.get(contact_email) if contact_email else None)
             if matched:
                 processed.add(matched['id'])
@@ -474,10 +651,12 @@ class EnhancedDatabaseSyncV3:
             else:
                 logger.warning(f"   Creating new vendor - not found by ID or email: {ghl_contact.get('email')}")
                 self._create_local_vendor(ghl_contact)
-        all_local = list(local_by_ghl_id.values()) + list(local_by_email.values())
-        missing = [v for v in all_local if v['id'] not in processed]
-        for v in missing:
-            self._handle_missing_ghl_vendor(v)
+        # A vendor indexed by both ghl_contact_id and email is flagged once
+        all_local_by_id = {v['id']: v for v in local_by_ghl_id.values()}
+        all_local_by_id.update((v['id'], v) for v in local_by_email.values())
+        for vendor_id, v in all_local_by_id.items():
+            if vendor_id not in processed:
+                self._handle_missing_ghl_vendor(v)
 
     def _update_local_vendor(self, local_vendor: Dict, ghl_contact: Dict):
         try:
@@ -491,14 +670,27 @@ class EnhancedDatabaseSyncV3:
             logger.error(f"❌ Error updating vendor {local_vendor.get('id')}: {e}")
             self.stats['errors'].append(str(e))
 
+    @staticmethod
+    def _custom_fields(ghl_contact: Dict) -> Dict[str, Any]:
+        """custom field id -> value for a GHL contact, built once and kept on the contact as '_cf'"""
+        custom_fields = ghl_contact.get('_cf')
+        if custom_fields is None:
+            custom_fields = {f.get('id', ''): (f.get('value', '') or f.get('fieldValue', ''))
+                             for f in ghl_contact.get('customFields', []) if f.get('id')}
+            ghl_contact['_cf'] = custom_fields
+        return custom_fields
+
+    @staticmethod
+    def _contact_name(ghl_contact: Dict) -> str:
+        """'firstName lastName' of a GHL contact, built once and kept on the contact as '_name'"""
+        name = ghl_contact.get('_name')
+        if name is None:
+            name = ghl_contact['_name'] = f"{ghl_contact.get('firstName', '')} {ghl_contact.get('lastName', '')}".strip()
+        return name
+
     def _extract_vendor_updates(self, vendor: Dict, ghl_contact: Dict) -> Dict[str, Any]:
         updates = {}
-        custom_fields = {}
-        for field in ghl_contact.get('customFields', []):
-            fid = field.get('id', '')
-            val = field.get('value', '') or field.get('fieldValue', '')
-            if fid:
-                custom_fields[fid] = val
+        custom_fields = self._custom_fields(ghl_contact)
         ghl_user = custom_fields.get('HXVNT4y8OynNokWAfO2D', '').strip()
         if ghl_user and not vendor.get('ghl_user_id'):
             updates['ghl_user_id'] = ghl_user
@@ -517,16 +709,16 @@ class EnhancedDatabaseSyncV3:
                 if vendor.get('coverage_type') != cov['type']:
                     updates['coverage_type'] = cov['type']
                 if cov['states']:
-                    updates['coverage_states'] = json.dumps(cov['states'])
+                    updates['coverage_states'] = _json_dumps(cov['states'])
                 if cov['counties']:
-                    updates['coverage_counties'] = json.dumps(cov['counties'])
+                    updates['coverage_counties'] = _json_dumps(cov['counties'])
         for db_field, ghl_field in self.VENDOR_GHL_FIELDS.items():
             if db_field == 'service_zip_codes':
                 continue
             current = vendor.get(db_field)
             new_value = None
             if db_field == 'name' and ghl_field == ['firstName', 'lastName']:
-                new_value = f"{ghl_contact.get('firstName', '')} {ghl_contact.get('lastName', '')}".strip()
+                new_value = self._contact_name(ghl_contact)
             elif ghl_field in ['email', 'phone']:
                 new_value = (ghl_contact.get(ghl_field) or '').strip()
             elif isinstance(ghl_field, list):
@@ -539,7 +731,7 @@ class EnhancedDatabaseSyncV3:
                 raw = custom_fields.get(ghl_field, '')
                 new_value = raw.strip() if isinstance(raw, str) else (str(raw) if raw else '')
             if db_field in ['service_categories', 'services_offered'] and new_value:
-                new_value = json.dumps([s.strip() for s in new_value.split(',') if s.strip()])
+                new_value = _json_dumps([s.strip() for s in new_value.split(',') if s.strip()])
             elif db_field == 'lead_close_percentage':
                 try:
                     new_value = float((new_value or '0').replace('%', '').strip()) if new_value else 0.0
@@ -569,31 +761,35 @@ class EnhancedDatabaseSyncV3:
         return {'type': None, 'states': None, 'counties': None}
 
     def _values_differ(self, current: Any, new: Any, field_name: str) -> bool:
+        if current == new:
+            return False  # the common no-change case; nothing to normalize
         if current is None and new == '':
             return False
         if current == '' and new is None:
             return False
-        if field_name in ['service_categories', 'services_offered', 'coverage_states', 'coverage_counties']:
-            try:
-                a = set(json.loads(current) if current else [])
-                b = set(json.loads(new) if new else [])
-                return a != b
-            except Exception:
-                return str(current) != str(new)
-        return str(current or '').strip() != str(new or '').strip()
+        try:
+            return _normalize_for_compare(field_name, current) != _normalize_for_compare(field_name, new)
+        except Exception:
+            return str(current) != str(new)
+
+    def _location_account(self) -> Optional[Dict]:
+        """Local account for the GHL location, looked up once per service instance."""
+        if self._account is None:
+            self._account = simple_db_instance.get_account_by_ghl_location_id(
+                os.getenv('GHL_LOCATION_ID') or AppConfig.GHL_LOCATION_ID)
+        return self._account
 
     def _create_local_vendor(self, ghl_contact: Dict):
         try:
-            custom_fields = {cf['id']: cf.get('value', '') for cf in ghl_contact.get('customFields', [])}
-            account = simple_db_instance.get_account_by_ghl_location_id(
-                os.getenv('GHL_LOCATION_ID') or AppConfig.GHL_LOCATION_ID)
+            custom_fields = self._custom_fields(ghl_contact)
+            account = self._location_account()
             if not account:
                 logger.error("❌ No account found for location")
                 return
             tag_status = get_vendor_status_from_tags(ghl_contact)
             vendor_id = simple_db_instance.create_vendor(
                 account_id=account['id'],
-                name=f"{ghl_contact.get('firstName', '')} {ghl_contact.get('lastName', '')}".strip(),
+                name=self._contact_name(ghl_contact),
                 email=ghl_contact.get('email', ''),
                 company_name=custom_fields.get('JexVrg2VNhnwIX7YlyJV', ''),
                 phone=ghl_contact.get('phone', ''),
@@ -621,14 +817,16 @@ class EnhancedDatabaseSyncV3:
         try:
             if not updates:
                 return True
-            conn = simple_db_instance._get_raw_conn()
+            if self._pending_vendor_updates is not None:
+                self._pending_vendor_updates.setdefault(vendor_id, {}).update(updates)
+                return True
+            conn = self._connection()
             cursor = conn.cursor()
             set_clauses = [f"{k} = ?" for k in updates]
             values = list(updates.values()) + [vendor_id]
             set_clauses.append("updated_at = CURRENT_TIMESTAMP")
             cursor.execute(f"UPDATE vendors SET {', '.join(set_clauses)} WHERE id = ?", values)
             conn.commit()
-            conn.close()
             return True
         except Exception as e:
             logger.error(f"❌ Error updating vendor {vendor_id}: {e}")
@@ -638,32 +836,72 @@ class EnhancedDatabaseSyncV3:
     # Lead sync (same logic as v2)
     # -------------------------------------------------------------------------
 
-    def _process_lead_sync(self, ghl_leads: Dict[str, Dict], local_leads: Dict[str, Dict]):
+    def _process_lead_sync(self, ghl_leads: Dict[str, Dict], local_leads_tuple: Tuple[Dict, Dict]):
+        self._prefetch_zip_locations(ghl_leads.values())
+        self._pending_lead_updates = {}
+        self._pending_new_leads = []
+        try:
+            self._sync_leads(ghl_leads, local_leads_tuple)
+        finally:
+            new_leads, self._pending_new_leads = self._pending_new_leads, None
+            self._flush_new_leads(new_leads)
+            pending, self._pending_lead_updates = self._pending_lead_updates, None
+            self._flush_updates('leads', pending, self._update_lead_record)
+
+    def _sync_leads(self, ghl_leads: Dict[str, Dict], local_leads_tuple: Tuple[Dict, Dict]):
+        local_by_ghl_id, local_by_email = local_leads_tuple
         processed = set()
         for ghl_id, ghl_contact in ghl_leads.items():
-            local_lead = local_leads.get(ghl_id)
-            if not local_lead and ghl_contact.get('email'):
-                local_lead = local_leads.get((ghl_contact.get('email') or '').strip().lower())
+            local_lead = local_by_ghl_id.get(ghl_id)
+            if not local_lead and ghl_contact['_email_lower']:
+                local_lead = local_by_email.get(ghl_contact['_email_lower'])
             if local_lead:
                 self._update_local_lead(local_lead, ghl_contact)
                 processed.add(local_lead['id'])
             else:
                 # GHL contact is a lead but not in local DB -> create local lead
                 self._create_local_lead(ghl_contact)
-        all_local_ids = set(lead['id'] for lead in local_leads.values())
+        # A lead indexed by both ghl_contact_id and email is one row; visit it once
+        local_by_id = {lead['id']: lead for lead in local_by_ghl_id.values()}
+        local_by_id.update((lead['id'], lead) for lead in local_by_email.values())
         ids_fetch_failed = getattr(self, '_lead_contact_ids_fetch_failed', set())
-        for local_lead_id in all_local_ids:
+        for local_lead_id, local_lead in local_by_id.items():
             if local_lead_id in processed:
                 continue
-            local_lead = next((lead for lead in local_leads.values() if lead['id'] == local_lead_id), None)
-            if not local_lead:
-                continue
             ghl_cid = local_lead.get('ghl_contact_id') or ''
             if ghl_cid and ghl_cid in ids_fetch_failed:
                 logger.warning(f"   Skipping mark-deleted for lead (ghl_contact_id {ghl_cid}): fetch failed")
                 continue
             self._handle_missing_lead(local_lead)
 
+    def _prefetch_zip_locations(self, ghl_contacts):
+        """Resolve every ZIP the lead contacts may need with one bulk lookup into _zip_cache."""
+        zips = set()
+        for c in ghl_contacts:
+            for z in (self._custom_fields(c).get('RmAja1dnU0u42ECXhCo9'), c.get('postalCode')):
+                z = str(z or '').strip()
+                if len(z) == 5:
+                    zips.add(z)
+            m = _ZIP_RE.search(c.get('address1') or '')
+            if m:
+                zips.add(m.group(1))
+        zips.difference_update(self._zip_cache)
+        if not zips:
+            return
+        try:
+            from api.services.location_service import location_service
+            self._zip_cache.update(location_service.zip_to_locations_bulk(zips))
+        except Exception as e:
+            logger.warning(f"   ZIP prefetch failed, looking up per lead: {e}")
+
+    def _zip_location(self, zip_code: str) -> Dict:
+        """location_service.zip_to_location, served from _zip_cache when prefetched."""
+        loc = self._zip_cache.get(zip_code)
+        if loc is None:
+            from api.services.location_service import location_service
+            loc = self._zip_cache[zip_code] = location_service.zip_to_location(zip_code)
+        return loc
+
     def _update_local_lead(self, local_lead: Dict, ghl_contact: Dict):
         try:
             updates = self._extract_lead_updates(local_lead, ghl_contact)
@@ -674,12 +912,18 @@ class EnhancedDatabaseSyncV3:
 
     def _extract_lead_updates(self, lead: Dict, ghl_contact: Dict) -> Dict[str, Any]:
         updates = {}
-        custom_fields = {cf['id']: cf.get('value', '') for cf in ghl_contact.get('customFields', [])}
+        # Contact not modified in GHL and lead row unchanged since a no-op diff -> still no-op
+        date_updated = ghl_contact.get('dateUpdated')
+        if date_updated:
+            unchanged_key = (date_updated, tuple(lead.get(field) for field in self._LEAD_DIFF_FIELDS))
+            if self._unchanged_leads.get(lead.get('id')) == unchanged_key:
+                return updates
+        custom_fields = self._custom_fields(ghl_contact)
         for db_field, ghl_field in self.LEAD_GHL_FIELDS.items():
             current = lead.get(db_field)
             new_value = None
             if db_field == 'customer_name' and ghl_field == ['firstName', 'lastName']:
-                new_value = f"{ghl_contact.get('firstName', '')} {ghl_contact.get('lastName', '')}".strip()
+                new_value = self._contact_name(ghl_contact)
             elif ghl_field == 'email':
                 new_value = (ghl_contact.get('email') or '').strip()
             elif ghl_field == 'phone':
@@ -693,8 +937,7 @@ class EnhancedDatabaseSyncV3:
         if ghl_contact.get('postalCode'):
             zip_code = str(ghl_contact.get('postalCode'))
         elif ghl_contact.get('address1'):
-            import re
-            m = re.search(r'\b(\d{5})\b', ghl_contact.get('address1', ''))
+            m = _ZIP_RE.search(ghl_contact.get('address1', ''))
             if m:
                 zip_code = m.group(1)
         if zip_code and lead.get('service_zip_code') != zip_code:
@@ -702,8 +945,7 @@ class EnhancedDatabaseSyncV3:
         zip_to_convert = updates.get('service_zip_code') or lead.get('service_zip_code')
         if zip_to_convert and len(str(zip_to_convert)) == 5:
             try:
-                from api.services.location_service import location_service
-                loc = location_service.zip_to_location(str(zip_to_convert))
+                loc = self._zip_location(str(zip_to_convert))
                 if not loc.get('error'):
                     if loc.get('county') and not lead.get('service_county'):
                         updates['service_county'] = loc.get('county', '')
@@ -715,69 +957,68 @@ class EnhancedDatabaseSyncV3:
         tag_status = get_lead_status_from_tags(ghl_contact)
         if tag_status is not None and lead.get('status') != tag_status:
             updates['status'] = tag_status
+        if date_updated:
+            if updates:
+                self._unchanged_leads.pop(lead.get('id'), None)
+            else:
+                self._unchanged_leads[lead.get('id')] = unchanged_key
         return updates
 
     def _create_local_lead(self, ghl_contact: Dict):
-        """Create new lead in local DB when contact exists in GHL but not locally."""
+        """Create new lead in local DB when contact exists in GHL but not locally (queued during a sync pass)."""
         try:
-            custom_fields = {cf['id']: cf.get('value', '') for cf in ghl_contact.get('customFields', [])}
-            account = simple_db_instance.get_account_by_ghl_location_id(
-                os.getenv('GHL_LOCATION_ID') or AppConfig.GHL_LOCATION_ID
-            )
-            if not account:
-                logger.error("❌ No account found for location - cannot create lead")
+            lead_data = self._build_new_lead_row(ghl_contact)
+            if not lead_data:
                 return
-            import uuid
-            status = get_lead_status_from_tags(ghl_contact) or "unassigned"
-            zip_code = (
-                custom_fields.get('RmAja1dnU0u42ECXhCo9', '') or
-                str(ghl_contact.get('postalCode') or '')
-            ).strip()
-            if not zip_code and ghl_contact.get('address1'):
-                import re
-                m = re.search(r'\b(\d{5})\b', ghl_contact.get('address1', ''))
-                if m:
-                    zip_code = m.group(1)
-            lead_data = {
-                'id': str(uuid.uuid4()),
-                'account_id': account['id'],
-                'ghl_contact_id': ghl_contact.get('id'),
-                'customer_name': f"{ghl_contact.get('firstName', '')} {ghl_contact.get('lastName', '')}".strip(),
-                'customer_email': ghl_contact.get('email', ''),
-                'customer_phone': ghl_contact.get('phone', ''),
-                'primary_service_category': custom_fields.get('HRqfv0HnUydNRLKWhk27', ''),
-                'specific_service_requested': custom_fields.get('FT85QGi0tBq1AfVGNJ9v', ''),
-                'customer_zip_code': zip_code,
-                'service_zip_code': zip_code,
-                'status': status,
-                'source': 'ghl_sync',
-            }
-            if zip_code and len(str(zip_code)) == 5:
-                try:
-                    from api.services.location_service import location_service
-                    loc = location_service.zip_to_location(str(zip_code))
-                    if not loc.get('error'):
-                        lead_data['service_county'] = loc.get('county', '')
-                        lead_data['service_state'] = loc.get('state', '')
-                except Exception:
-                    pass
-            conn = simple_db_instance._get_raw_conn()
-            cursor = conn.cursor()
-            columns = list(lead_data.keys())
-            placeholders = ['?' for _ in columns]
-            values = [lead_data[col] for col in columns]
-            cursor.execute(
-                f"INSERT INTO leads ({', '.join(columns)}) VALUES ({', '.join(placeholders)})",
-                values,
-            )
-            conn.commit()
-            conn.close()
-            self.stats['leads_created'] += 1
-            logger.info(f"✅ Created NEW lead from GHL: {lead_data['customer_name']}")
+            if self._pending_new_leads is not None:
+                self._pending_new_leads.append(lead_data)
+                return
+            self._insert_leads([lead_data])
         except Exception as e:
             logger.error(f"❌ Error creating lead from GHL: {e}")
             self.stats['errors'].append(f"Create lead: {str(e)}")
 
+    def _build_new_lead_row(self, ghl_contact: Dict) -> Optional[Dict[str, Any]]:
+        """leads row for a GHL contact (no DB write); None when no account is configured."""
+        custom_fields = self._custom_fields(ghl_contact)
+        account = self._location_account()
+        if not account:
+            logger.error("❌ No account found for location - cannot create lead")
+            return None
+        import uuid
+        status = get_lead_status_from_tags(ghl_contact) or "unassigned"
+        zip_code = (
+            custom_fields.get('RmAja1dnU0u42ECXhCo9', '') or
+            str(ghl_contact.get('postalCode') or '')
+        ).strip()
+        if not zip_code and ghl_contact.get('address1'):
+            m = _ZIP_RE.search(ghl_contact.get('address1', ''))
+            if m:
+                zip_code = m.group(1)
+        lead_data = {
+            'id': str(uuid.uuid4()),
+            'account_id': account['id'],
+            'ghl_contact_id': ghl_contact.get('id'),
+            'customer_name': self._contact_name(ghl_contact),
+            'customer_email': ghl_contact.get('email', ''),
+            'customer_phone': ghl_contact.get('phone', ''),
+            'primary_service_category': custom_fields.get('HRqfv0HnUydNRLKWhk27', ''),
+            'specific_service_requested': custom_fields.get('FT85QGi0tBq1AfVGNJ9v', ''),
+            'customer_zip_code': zip_code,
+            'service_zip_code': zip_code,
+            'status': status,
+            'source': 'ghl_sync',
+        }
+        if zip_code and len(str(zip_code)) == 5:
+            try:
+                loc = self._zip_location(str(zip_code))
+                if not loc.get('error'):
+                    lead_data['service_county'] = loc.get('county', '')
+                    lead_data['service_state'] = loc.get('state', '')
+            except Exception:
+                pass
+        return lead_data
+
     def _handle_missing_lead(self, local_lead: Dict):
         """Set lead status to inactive_ghl_deleted when not found in GHL contacts."""
         try:
@@ -790,19 +1031,97 @@ class EnhancedDatabaseSyncV3:
         try:
             if not updates:
                 return True
-            conn = simple_db_instance._get_raw_conn()
+            if self._pending_lead_updates is not None:
+                self._pending_lead_updates.setdefault(lead_id, {}).update(updates)
+                return True
+            conn = self._connection()
             cursor = conn.cursor()
             set_clauses = [f"{k} = ?" for k in updates]
             values = list(updates.values()) + [lead_id]
             set_clauses.append("updated_at = CURRENT_TIMESTAMP")
             cursor.execute(f"UPDATE leads SET {', '.join(set_clauses)} WHERE id = ?", values)
             conn.commit()
-            conn.close()
             return True
         except Exception as e:
             logger.error(f"❌ Error updating lead {lead_id}: {e}")
             return False
 
+    # -------------------------------------------------------------------------
+    # Batched writes
+    # -------------------------------------------------------------------------
+
+    def _flush_updates(self, table: str, pending: Dict[str, Dict], write_one) -> None:
+        """
+        Write buffered {row_id: updates} to `table` in one transaction. Rows changing the same
+        columns share one UPDATE ... SET col = CASE id WHEN ? THEN ? ... END WHERE id IN (...).
+        If the batch fails it is rolled back and each row is retried with write_one.
+        """
+        if not pending:
+            return
+        groups: Dict[Tuple[str, ...], List[Tuple[str, Dict]]] = {}
+        for row_id, updates in pending.items():
+            groups.setdefault(tuple(sorted(updates)), []).append((row_id, updates))
+        conn = self._connection()
+        try:
+            cursor = conn.cursor()
+            for cols, rows in groups.items():
+                per_statement = max(1, SQLITE_MAX_VARIABLES // (2 * len(cols) + 1))
+                for start in range(0, len(rows), per_statement):
+                    chunk = rows[start:start + per_statement]
+                    when_then = ' '.join(['WHEN ? THEN ?'] * len(chunk))
+                    set_clauses = [f"{col} = CASE id {when_then} END" for col in cols]
+                    set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+                    values = [v for col in cols for row_id, updates in chunk for v in (row_id, updates[col])]
+                    values += [row_id for row_id, _ in chunk]
+                    cursor.execute(
+                        f"UPDATE {table} SET {', '.join(set_clauses)} "
+                        f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                        values,
+                    )
+            conn.commit()
+            logger.info(f"   💾 Wrote {len(pending)} {table} updates in one transaction")
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"❌ Batched {table} update failed, retrying row by row: {e}")
+            for row_id, updates in pending.items():
+                write_one(row_id, updates)
+
+    def _insert_leads(self, rows: List[Dict]):
+        """INSERT lead rows in one transaction, one executemany per column set. Rolls back and raises on error."""
+        groups: Dict[Tuple[str, ...], List[Dict]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row), []).append(row)
+        conn = self._connection()
+        try:
+            cursor = conn.cursor()
+            for columns, group in groups.items():
+                cursor.executemany(
+                    f"INSERT INTO leads ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    [tuple(row[col] for col in columns) for row in group],
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        self.stats['leads_created'] += len(rows)
+        for row in rows:
+            logger.info(f"✅ Created NEW lead from GHL: {row['customer_name']}")
+
+    def _flush_new_leads(self, rows: List[Dict]):
+        """Insert the leads queued by _create_local_lead; if the batch fails, retry each row on its own."""
+        if not rows:
+            return
+        try:
+            self._insert_leads(rows)
+        except Exception as e:
+            logger.error(f"❌ Batched lead insert failed, retrying row by row: {e}")
+            for row in rows:
+                try:
+                    self._insert_leads([row])
+                except Exception as row_error:
+                    logger.error(f"❌ Error creating lead from GHL: {row_error}")
+                    self.stats['errors'].append(f"Create lead: {str(row_error)}")
+
 
 if __name__ == "__main__":
     print("🚀 Enhanced Database Sync V3 (unified contact fetch)")
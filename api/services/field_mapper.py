@@ -1,13 +1,37 @@
 # api/services/field_mapper.py
 
-import json
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any, List, Set
+from typing import Dict, Optional, Any, List, FrozenSet
 from datetime import datetime
 
+# orjson is an optional, faster drop-in for reading/writing the mapping and reference files
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 logger = logging.getLogger(__name__)
 
+# Standard GHL contact fields (valid alongside the custom fields from field_reference.json)
+STANDARD_GHL_FIELDS = frozenset({
+    "firstName", "lastName", "email", "phone", "companyName",
+    "address1", "city", "state", "postal_code", "name",
+    "tags", "notes", "dnd", "country", "source", "website"
+})
+
 def _default_field_reference_path() -> str:
     """Path to field_reference.json under app data (data/) to avoid permission errors."""
     try:
@@ -34,13 +58,17 @@ class FieldMapper:
         self._mappings = {}
         self._field_reference = {}
         self._ghl_field_mapping = {}  # Maps GHL field keys to their details (ID, name, etc.)
+        self._id_to_key = {}  # Maps GHL field IDs back to their field keys
+        self._all_field_keys = STANDARD_GHL_FIELDS  # Standard + custom field keys
         self._reverse_mappings = {}  # Maps GHL field keys back to form field names
+        self._default_map = {}  # default_mappings, for industries without overrides
+        self._merged_by_industry = {}  # industry -> default mappings overlaid with its own
         
         # Load all data
         self.load_mappings()
         self.load_field_reference()
         self._build_ghl_field_mapping()
-        self._generate_reverse_mappings()
+        self._rebuild_indexes()
         
         logger.info(f"✅ FieldMapper initialized with {len(self._mappings.get('default_mappings', {}))} default mappings and {len(self._ghl_field_mapping)} GHL fields")
     
@@ -48,8 +76,8 @@ class FieldMapper:
         """Load field mappings from JSON file"""
         try:
             if self._mappings_file.exists():
-                with open(self._mappings_file, 'r') as f:
-                    self._mappings = json.load(f)
+                with open(self._mappings_file, 'rb') as f:
+                    self._mappings = _json_loads(f.read())
                 logger.info(f"✅ Loaded field mappings from {self._mappings_file}")
                 
                 # Validate structure
@@ -149,8 +177,8 @@ class FieldMapper:
         """Load GHL field reference data from field_reference.json"""
         try:
             if self._reference_file.exists():
-                with open(self._reference_file, 'r') as f:
-                    self._field_reference = json.load(f)
+                with open(self._reference_file, 'rb') as f:
+                    self._field_reference = _json_loads(f.read())
                 logger.info(f"✅ Loaded field reference from {self._reference_file}")
                 
                 all_fields_count = len(self._field_reference.get('all_ghl_fields', {}))
@@ -197,14 +225,28 @@ class FieldMapper:
                 }
                 processed_count += 1
         
+        # Reverse index for get_ghl_field_details_by_id (first key per ID, in mapping order)
+        self._id_to_key = {}
+        for api_key, details in self._ghl_field_mapping.items():
+            self._id_to_key.setdefault(details["id"], api_key)
+        self._all_field_keys = STANDARD_GHL_FIELDS.union(self._ghl_field_mapping)
+        
         logger.info(f"🔗 Built GHL field mapping: {processed_count} custom fields processed from {len(all_ghl_fields)} total fields")
     
-    def _generate_reverse_mappings(self):
-        """Generate reverse mappings (GHL field -> form field) for all industries"""
+    def _rebuild_indexes(self):
+        """
+        Rebuild the lookup indexes derived from self._mappings: per-industry merged
+        mappings (used by get_mapping) and reverse mappings (GHL field -> form field).
+        """
         self._reverse_mappings = {}
         
         # Default mappings
         default_mappings = self._mappings.get("default_mappings", {})
+        self._default_map = dict(default_mappings)
+        self._merged_by_industry = {
+            industry: {**default_mappings, **mappings}
+            for industry, mappings in self._mappings.get("industry_specific", {}).items()
+        }
         for form_field, ghl_field in default_mappings.items():
             # Use the first form field that maps to each GHL field
             if ghl_field not in self._reverse_mappings:
@@ -232,23 +274,8 @@ class FieldMapper:
         if not field_name:
             return field_name
         
-        # Check industry-specific mappings first (highest priority)
-        industry_mappings = self._mappings.get("industry_specific", {}).get(industry, {})
-        if field_name in industry_mappings:
-            mapped = industry_mappings[field_name]
-            logger.debug(f"🏭 Industry mapping ({industry}): {field_name} → {mapped}")
-            return mapped
-        
-        # Check default mappings
-        default_mappings = self._mappings.get("default_mappings", {})
-        if field_name in default_mappings:
-            mapped = default_mappings[field_name]
-            logger.debug(f"🔄 Default mapping: {field_name} → {mapped}")
-            return mapped
-        
-        # Return original if no mapping found
-        logger.debug(f"➡️ No mapping found for '{field_name}', using original")
-        return field_name
+        # Industry-specific mappings already override the defaults in the merged map
+        return self._merged_by_industry.get(industry, self._default_map).get(field_name, field_name)
     
     def get_reverse_mapping(self, ghl_field_name: str, industry: str = "marine") -> str:
         """
@@ -272,35 +299,27 @@ class FieldMapper:
         This is used by the county-based vendor creation system to extract data
         from GHL contact records when we know the field ID but need the key.
         """
-        for field_key, field_details in self._ghl_field_mapping.items():
-            if field_details.get("id") == field_id:
-                return {
-                    "key": field_key,
-                    "id": field_id,
-                    "fieldKey": field_details.get("fieldKey"),
-                    "name": field_details.get("name"),
-                    "dataType": field_details.get("dataType", "TEXT"),
-                    "model": field_details.get("model", "contact")
-                }
-        return None
+        field_key = self._id_to_key.get(field_id)
+        if field_key is None:
+            return None
+        field_details = self._ghl_field_mapping[field_key]
+        return {
+            "key": field_key,
+            "id": field_id,
+            "fieldKey": field_details.get("fieldKey"),
+            "name": field_details.get("name"),
+            "dataType": field_details.get("dataType", "TEXT"),
+            "model": field_details.get("model", "contact")
+        }
     
-    def get_all_ghl_field_keys(self) -> Set[str]:
+    def get_all_ghl_field_keys(self) -> FrozenSet[str]:
         """
         Get all valid GHL field keys (standard + custom).
         
-        Used by webhook_routes.py for field validation.
+        Used by webhook_routes.py for field validation. Built with the GHL field mapping,
+        so this is the same (read-only) set on every call.
         """
-        # Standard GHL contact fields
-        standard_fields = {
-            "firstName", "lastName", "email", "phone", "companyName", 
-            "address1", "city", "state", "postal_code", "name",
-            "tags", "notes", "dnd", "country", "source", "website"
-        }
-        
-        # Custom field keys from field_reference.json
-        custom_field_keys = set(self._ghl_field_mapping.keys())
-        
-        return standard_fields.union(custom_field_keys)
+        return self._all_field_keys
     
     def is_valid_ghl_field(self, field_name: str) -> bool:
         """
@@ -308,7 +327,7 @@ class FieldMapper:
         
         Used by webhook_routes.py for field validation.
         """
-        return field_name in self.get_all_ghl_field_keys()
+        return field_name in self._all_field_keys
     
     def map_payload(self, payload: Dict[str, Any], industry: str = "marine") -> Dict[str, Any]:
         """
@@ -360,8 +379,6 @@ class FieldMapper:
             self._mappings["default_mappings"][source_field] = target_field
             logger.info(f"➕ Added default mapping: {source_field} → {target_field}")
         
-        # Update reverse mappings and save
-        self._generate_reverse_mappings()
         self.save_mappings()
     
     def remove_mapping(self, source_field: str, industry: Optional[str] = None):
@@ -382,7 +399,6 @@ class FieldMapper:
                 logger.info(f"🗑️ Removed default mapping: {source_field}")
         
         if removed:
-            self._generate_reverse_mappings()
             self.save_mappings()
         else:
             logger.warning(f"⚠️ No mapping found to remove: {source_field} (industry: {industry or 'default'})")
@@ -400,7 +416,6 @@ class FieldMapper:
             self._mappings["metadata"] = {}
         self._mappings["metadata"]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        self._generate_reverse_mappings()
         self.save_mappings()
         logger.info("🔄 Updated all field mappings from external source")
     
@@ -429,14 +444,20 @@ class FieldMapper:
     
     def save_mappings(self):
         """Save current mappings to JSON file"""
+        # Callers (including subclasses) mutate self._mappings directly before saving,
+        # so refresh the lookup indexes get_mapping/get_reverse_mapping read from
+        self._rebuild_indexes()
         try:
             # Ensure metadata is updated
             if "metadata" not in self._mappings:
                 self._mappings["metadata"] = {}
             self._mappings["metadata"]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            with open(self._mappings_file, 'w') as f:
-                json.dump(self._mappings, f, indent=2)
+            # Write to a temp file and swap it in, so readers never see a half-written file
+            tmp_file = self._mappings_file.with_name(self._mappings_file.name + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(self._mappings))
+            os.replace(tmp_file, self._mappings_file)
             logger.debug(f"💾 Saved field mappings to {self._mappings_file}")
         except Exception as e:
             logger.error(f"❌ Error saving field mappings: {e}")
@@ -533,5 +554,15 @@ class FieldMapper:
         }
 
 
-# Global singleton instance
-field_mapper = FieldMapper()
+@lru_cache(maxsize=None)
+def get_field_mapper() -> FieldMapper:
+    """Get the shared FieldMapper, loading the mapping files on first use"""
+    return FieldMapper()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from api.services.field_mapper import field_mapper` working without
+    # paying the file load and index build at import time
+    if name == "field_mapper":
+        return get_field_mapper()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
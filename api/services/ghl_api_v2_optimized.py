@@ -8,11 +8,38 @@ Only falls back to v1 for vendor user creation
 import requests
 import logging
 import json
-from typing import Dict, List, Optional, Any
+import random
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Backoff for HTTP 429 (rate limited) responses on contact reads/searches
+RATE_LIMIT_MAX_ATTEMPTS = 3
+RATE_LIMIT_BACKOFF_BASE = 0.5  # seconds; doubles per retry
+RATE_LIMIT_BACKOFF_CAP = 4.0
+
+
+def _request_with_backoff(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    requests.request() that retries HTTP 429 with capped exponential backoff plus jitter
+    (Retry-After is used when GHL sends it). Any other response is returned as-is, so a
+    rate-limited read is retried instead of being reported as "not found".
+    """
+    for attempt in range(RATE_LIMIT_MAX_ATTEMPTS):
+        response = requests.request(method, url, **kwargs)
+        if response.status_code != 429 or attempt == RATE_LIMIT_MAX_ATTEMPTS - 1:
+            return response
+        try:
+            delay = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            delay = RATE_LIMIT_BACKOFF_BASE * 2 ** attempt
+        delay = min(RATE_LIMIT_BACKOFF_CAP, delay) + random.random() * 0.1
+        logger.warning(f"⏳ GHL rate limit (429) on {url} - retrying in {delay:.2f}s")
+        time.sleep(delay)
+    return response
+
 class OptimizedGoHighLevelAPI:
     """
     Optimized GHL API client that uses v2 endpoints by default
@@ -105,7 +132,7 @@ class OptimizedGoHighLevelAPI:
                 "locationId": loc,
                 "query": email.strip(),
             }
-            response = requests.post(url, headers=self.v2_headers, json=payload, timeout=15)
+            response = _request_with_backoff("POST", url, headers=self.v2_headers, json=payload, timeout=15)
             if response.status_code == 200:
                 data = response.json()
                 contacts = data.get("contacts", [])
@@ -123,6 +150,37 @@ class OptimizedGoHighLevelAPI:
             logger.warning(f"   search_contacts_by_email failed for {email[:3]}...: {e}")
             return []
 
+    def search_contacts_by_values(
+        self,
+        field: str,
+        values: List[str],
+        location_id: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Find contacts whose `field` (e.g. "email" or "id") matches any of `values`
+        with one POST /contacts/search request (send at most 100 values per call).
+        Ref: https://marketplace.gohighlevel.com/docs/ghl/contacts/search-contacts-advanced
+        """
+        if not values:
+            return []
+        try:
+            url = f"{self.v2_base_url}/contacts/search"
+            payload = {
+                "locationId": location_id or self.location_id,
+                "limit": min(len(values), 100),
+                "filters": [{"field": field, "operator": "eq", "value": list(values)}],
+            }
+            response = _request_with_backoff("POST", url, headers=self.v2_headers, json=payload, timeout=30)
+            if response.status_code != 200:
+                logger.warning(f"   POST /contacts/search ({field} filter) returned {response.status_code}: {response.text[:200]}")
+                return []
+            contacts = response.json().get("contacts") or []
+            logger.info(f"✅ Found {len(contacts)} contact(s) for {len(values)} {field} value(s) via POST /contacts/search")
+            return contacts
+        except Exception as e:
+            logger.warning(f"   search_contacts_by_values failed for {field}: {e}")
+            return []
+
     def search_contacts_paginated(
         self,
         location_id: Optional[str] = None,
@@ -154,7 +212,7 @@ class OptimizedGoHighLevelAPI:
                 payload["query"] = str(query).strip()
             if search_after is not None and len(search_after) > 0:
                 payload["searchAfter"] = search_after
-            response = requests.post(url, headers=self.v2_headers, json=payload, timeout=30)
+            response = _request_with_backoff("POST", url, headers=self.v2_headers, json=payload, timeout=30)
             if response.status_code != 200:
                 logger.error(f"❌ POST /contacts/search failed: {response.status_code} - {response.text[:200]}")
                 return {"contacts": [], "total": 0, "search_after": None}
@@ -172,22 +230,32 @@ class OptimizedGoHighLevelAPI:
     
     def get_contact_by_id(self, contact_id: str, location_id: Optional[str] = None) -> Optional[Dict]:
         """Get contact by ID using v2 API. Pass location_id to scope to a location (recommended)."""
+        contact, _ = self.get_contact_by_id_with_status(contact_id, location_id=location_id)
+        return contact
+
+    def get_contact_by_id_with_status(
+        self, contact_id: str, location_id: Optional[str] = None
+    ) -> Tuple[Optional[Dict], Optional[int]]:
+        """
+        Like get_contact_by_id, but also returns the HTTP status (None when the request
+        itself failed), so callers can tell "not found in GHL" apart from GHL errors.
+        """
         try:
             url = f"{self.v2_base_url}/contacts/{contact_id}"
             params = {}
             if location_id or self.location_id:
                 params["locationId"] = location_id or self.location_id
-            response = requests.get(url, headers=self.v2_headers, params=params or None, timeout=15)
+            response = _request_with_backoff("GET", url, headers=self.v2_headers, params=params or None, timeout=15)
             if response.status_code == 200:
                 data = response.json()
                 logger.info(f"✅ Retrieved contact {contact_id} using v2 API")
-                return data.get('contact', data)
+                return data.get('contact', data), response.status_code
             else:
                 logger.error(f"❌ Failed to get contact {contact_id}: {response.status_code}")
-                return None
+                return None, response.status_code
         except Exception as e:
             logger.error(f"❌ Error getting contact {contact_id}: {str(e)}")
-            return None
+            return None, None
     
     def create_contact(self, contact_data: Dict) -> Optional[Dict]:
         """Create contact using v2 API for improved performance"""
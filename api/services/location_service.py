@@ -59,28 +59,60 @@ class LocationService:
 
         try:
             location_data = self.geo_us.query_postal_code(normalized_zip)
-            
-            # Handle pandas checking gracefully
-            pd = get_module('pandas')
-            if pd and pd.isna(location_data.county_name):
-                return {'error': f'ZIP code not found: {normalized_zip}'}
-            elif not pd and not location_data.county_name:
-                return {'error': f'ZIP code not found: {normalized_zip}'}
-
-            return {
-                'state': location_data.state_code,
-                'county': location_data.county_name,
-                'city': location_data.place_name,
-                'zipcode': location_data.postal_code,
-                'lat': location_data.latitude,
-                'lng': location_data.longitude,
-                'accuracy': location_data.accuracy,
-                'error': None
-            }
+            return self._location_from_record(normalized_zip, location_data)
         except Exception as e:
             logger.error(f"❌ Error looking up ZIP code {normalized_zip}: {e}")
             return {'error': f'Lookup error: {str(e)}'}
 
+    def zip_to_locations_bulk(self, zip_codes) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Convert many ZIP codes with a single pgeocode query.
+        Returns {zip_code: result} where each result has the same shape as zip_to_location.
+        """
+        zip_codes = [z for z in dict.fromkeys(zip_codes) if z]
+        if not zip_codes:
+            return {}
+        if not is_available('pgeocode') or not self.geo_us:
+            return {z: self.zip_to_location(z) for z in zip_codes}
+
+        normalized = {z: self.normalize_zip_code(z) for z in zip_codes}
+        unique_zips = sorted({n for n in normalized.values() if n})
+        try:
+            frame = self.geo_us.query_postal_code(unique_zips) if unique_zips else None
+            # pgeocode returns one row per queried code, in query order
+            by_zip = {
+                n: self._location_from_record(n, record)
+                for n, record in zip(unique_zips, frame.itertuples(index=False))
+            } if unique_zips else {}
+        except Exception as e:
+            logger.error(f"❌ Error looking up {len(unique_zips)} ZIP codes: {e}")
+            return {z: self.zip_to_location(z) for z in zip_codes}
+
+        return {
+            z: by_zip.get(n) or {'error': f'Invalid ZIP code format: {z}'}
+            for z, n in normalized.items()
+        }
+
+    def _location_from_record(self, normalized_zip: str, location_data) -> Dict[str, Optional[str]]:
+        """Build the zip_to_location result from one pgeocode record."""
+        # Handle pandas checking gracefully
+        pd = get_module('pandas')
+        if pd and pd.isna(location_data.county_name):
+            return {'error': f'ZIP code not found: {normalized_zip}'}
+        elif not pd and not location_data.county_name:
+            return {'error': f'ZIP code not found: {normalized_zip}'}
+
+        return {
+            'state': location_data.state_code,
+            'county': location_data.county_name,
+            'city': location_data.place_name,
+            'zipcode': location_data.postal_code,
+            'lat': location_data.latitude,
+            'lng': location_data.longitude,
+            'accuracy': location_data.accuracy,
+            'error': None
+        }
+
     def get_state_counties(self, state_abbr: str) -> List[str]:
         """
         Get all unique counties for a given state abbreviation.
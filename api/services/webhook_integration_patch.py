@@ -17,7 +17,7 @@ from datetime import datetime
 from api.services.service_dictionary_mapper import service_dictionary_mapper
 
 # Import existing modules
-from api.services.field_mapper import field_mapper
+from api.services.field_mapper import get_field_mapper
 from config import AppConfig
 
 logger = logging.getLogger(__name__)
@@ -31,9 +31,13 @@ class EnhancedWebhookProcessor:
     
     def __init__(self):
         self.service_mapper = service_dictionary_mapper
-        self.field_mapper = field_mapper
         logger.info("✅ Enhanced Webhook Processor initialized with Service Dictionary Mapper")
     
+    @property
+    def field_mapper(self):
+        """Shared FieldMapper, loaded on first use rather than at import"""
+        return get_field_mapper()
+    
     def process_form_with_service_mapping(self, 
                                          form_data: Dict[str, Any], 
                                          form_identifier: str) -> Dict[str, Any]:
@@ -15,10 +15,10 @@ from typing import Dict, List, Any, Optional, Set
 VENDOR_SOURCE_KEYWORD = "Vendor Application"
 
 # Tags that indicate a contact is a vendor (case-insensitive)
-VENDOR_TAGS = {"new vendor", "new vendor application", "manually approved"}
+VENDOR_TAGS = frozenset({"new vendor", "new vendor application", "manually approved"})
 
 # Tags that indicate a contact is a lead
-LEAD_TAGS = {"new lead"}
+LEAD_TAGS = frozenset({"new lead"})
 
 # Lead: if "new lead" tag -> status "new"
 LEAD_TAG_NEW_LEAD_STATUS = "new"
@@ -33,6 +33,9 @@ VENDOR_TAG_LEVELS = [
     (5, "reactivated", "active"),
 ]
 
+# tag -> (level, status), so scoring only looks at tags the contact actually has
+_VENDOR_TAG_TO_LEVEL = {tag: (level, status) for level, tag, status in VENDOR_TAG_LEVELS}
+
 DEFAULT_VENDOR_STATUS = "pending"
 DEFAULT_LEAD_STATUS = "pending"
 
@@ -47,7 +50,13 @@ INACTIVE_GHL_DELETED_STATUS = "inactive_ghl_deleted"
 # ---------------------------------------------------------------------------
 
 def get_contact_tags_list(ghl_contact: Dict[str, Any]) -> List[str]:
-    """Return normalized list of tag strings (lowercase) from a GHL contact."""
+    """
+    Return normalized list of tag strings (lowercase) from a GHL contact.
+    Reuses the list cached on the contact as "_tags_lower" when a caller precomputed it.
+    """
+    cached = ghl_contact.get("_tags_lower")
+    if cached is not None:
+        return cached
     tags_raw = ghl_contact.get("tags") or []
     if isinstance(tags_raw, str):
         return [t.strip().lower() for t in tags_raw.split(",") if t.strip()]
@@ -80,7 +89,7 @@ def is_vendor_by_ghl_signals(ghl_contact: Dict[str, Any]) -> bool:
     if VENDOR_SOURCE_KEYWORD.lower() in source.lower():
         return True
     tags = get_contact_tags_list(ghl_contact)
-    return bool(tags and any(t in VENDOR_TAGS for t in tags))
+    return not VENDOR_TAGS.isdisjoint(tags)
 
 
 def is_staff_contact(ghl_contact: Dict[str, Any]) -> bool:
@@ -137,13 +146,10 @@ def classify_contact(
 def get_vendor_status_from_tags(ghl_contact: Dict[str, Any]) -> str:
     """Vendor status from tags by level; higher level wins. Default is DEFAULT_VENDOR_STATUS."""
     tags_list = get_contact_tags_list(ghl_contact)
-    tags_set = set(tags_list)
-    best_level = -1
-    status = DEFAULT_VENDOR_STATUS
-    for level, tag, st in VENDOR_TAG_LEVELS:
-        if tag in tags_set and level > best_level:
-            best_level = level
-            status = st
+    _, status = max(
+        (_VENDOR_TAG_TO_LEVEL[t] for t in tags_list if t in _VENDOR_TAG_TO_LEVEL),
+        default=(-1, DEFAULT_VENDOR_STATUS),
+    )
     return status
 
 